@@ -1,6 +1,8 @@
 """Enhanced health and monitoring endpoints"""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Dict, Any
 
@@ -12,16 +14,19 @@ from app.models.user import User
 
 router = APIRouter()
 
+# The basic health payload never changes, so it is encoded once
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "DNSMate API",
+    "version": "1.0.0",
+    "timestamp": "2025-08-07T00:00:00Z"
+})
+
 
 @router.get("/health", tags=["monitoring"])
 async def health_check():
     """Basic health check endpoint"""
-    return {
-        "status": "healthy",
-        "service": "DNSMate API",
-        "version": "1.0.0",
-        "timestamp": "2025-08-07T00:00:00Z"
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @router.get("/health/detailed", tags=["monitoring"])
@@ -43,7 +48,8 @@ async def detailed_health_check(
     powerdns_health = await multi_powerdns_service.get_health_status(db)
     health_data["powerdns"] = powerdns_health
     
-    return health_data
+    # Plain JSON types only: hand the dict straight to orjson, skipping jsonable_encoder
+    return ORJSONResponse(health_data)
 
 
 @router.get("/metrics", tags=["monitoring"])
@@ -57,7 +63,7 @@ async def get_metrics(
             detail="Admin access required"
         )
     
-    return await get_application_metrics()
+    return ORJSONResponse(await get_application_metrics())
 
 
 @router.get("/status/powerdns", tags=["monitoring"])
@@ -72,7 +78,7 @@ async def get_powerdns_status(
             detail="Editor or admin access required"
         )
     
-    return await multi_powerdns_service.get_health_status(db)
+    return ORJSONResponse(await multi_powerdns_service.get_health_status(db))
 
 
 # Register health checks
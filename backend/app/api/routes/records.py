@@ -1,5 +1,6 @@
 """DNS Record management routes"""
 
+import logging
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
@@ -11,6 +12,9 @@ from app.models.user import User, ZonePermission, UserRole
 from app.schemas.dns import RecordCreate, RecordRead, RecordUpdate
 from app.services.powerdns import PowerDNSClient, PowerDNSRecord
 from app.services.multi_powerdns import multi_powerdns_service
+from app.services.versioning import ZoneVersioningService
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -114,7 +118,6 @@ async def create_record(
         if result.is_complete_success:
             # Auto-create version if enabled
             try:
-                from app.services.versioning import ZoneVersioningService
                 versioning_service = ZoneVersioningService(session)
                 await versioning_service.auto_create_version_if_enabled(
                     zone_name=zone_name,
@@ -124,8 +127,6 @@ async def create_record(
                 )
             except Exception as e:
                 # Log but don't fail the request
-                import logging
-                logger = logging.getLogger(__name__)
                 logger.warning(f"Failed to auto-create version: {e}")
             
             return RecordRead(
@@ -139,8 +140,8 @@ async def create_record(
             )
         elif result.is_partial_success:
             # Some servers succeeded, some failed
-            success_servers = [r["server_name"] for r in result.results if r["success"]]
-            failed_servers = [f"{r['server_name']}: {r['error']}" for r in result.results if not r["success"]]
+            success_servers = [r.server_name for r in result.results if r.success]
+            failed_servers = [f"{r.server_name}: {r.error}" for r in result.results if not r.success]
             
             raise HTTPException(
                 status_code=status.HTTP_207_MULTI_STATUS,
@@ -153,7 +154,7 @@ async def create_record(
             )
         else:
             # All servers failed
-            error_details = [f"{r['server_name']}: {r['error']}" for r in result.results]
+            error_details = [f"{r.server_name}: {r.error}" for r in result.results]
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
@@ -203,8 +204,8 @@ async def update_record(
             return {"message": "Record updated successfully on all servers"}
         elif result.is_partial_success:
             # Some servers succeeded, some failed
-            success_servers = [r["server_name"] for r in result.results if r["success"]]
-            failed_servers = [f"{r['server_name']}: {r['error']}" for r in result.results if not r["success"]]
+            success_servers = [r.server_name for r in result.results if r.success]
+            failed_servers = [f"{r.server_name}: {r.error}" for r in result.results if not r.success]
             
             raise HTTPException(
                 status_code=status.HTTP_207_MULTI_STATUS,
@@ -217,7 +218,7 @@ async def update_record(
             )
         else:
             # All servers failed
-            error_details = [f"{r['server_name']}: {r['error']}" for r in result.results]
+            error_details = [f"{r.server_name}: {r.error}" for r in result.results]
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
@@ -255,7 +256,6 @@ async def delete_record(
         if result.is_complete_success:
             # Auto-create version if enabled
             try:
-                from app.services.versioning import ZoneVersioningService
                 versioning_service = ZoneVersioningService(session)
                 await versioning_service.auto_create_version_if_enabled(
                     zone_name=zone_name,
@@ -265,15 +265,13 @@ async def delete_record(
                 )
             except Exception as e:
                 # Log but don't fail the request
-                import logging
-                logger = logging.getLogger(__name__)
                 logger.warning(f"Failed to auto-create version: {e}")
             
             return {"message": f"Record {record_name} ({record_type}) deleted successfully from all servers"}
         elif result.is_partial_success:
             # Some servers succeeded, some failed
-            success_servers = [r["server_name"] for r in result.results if r["success"]]
-            failed_servers = [f"{r['server_name']}: {r['error']}" for r in result.results if not r["success"]]
+            success_servers = [r.server_name for r in result.results if r.success]
+            failed_servers = [f"{r.server_name}: {r.error}" for r in result.results if not r.success]
             
             raise HTTPException(
                 status_code=status.HTTP_207_MULTI_STATUS,
@@ -286,7 +284,7 @@ async def delete_record(
             )
         else:
             # All servers failed
-            error_details = [f"{r['server_name']}: {r['error']}" for r in result.results]
+            error_details = [f"{r.server_name}: {r.error}" for r in result.results]
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
@@ -1,15 +1,18 @@
 """Security-related API routes"""
 
 import logging
+import secrets
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.database import get_async_session
 from app.core.auth import current_active_user
 from app.models.user import User
-from app.services.email import EmailService
+from app.services.email import EmailService, get_email_service
 from app.services.password_policy import PasswordPolicy
 from app.models.audit import AuditService, AuditEventType
 from app.schemas.user import UserUpdate
@@ -63,7 +66,8 @@ async def change_password(
     request: PasswordChangeRequest,
     http_request: Request,
     current_user: User = Depends(current_active_user),
-    session: AsyncSession = Depends(get_async_session)
+    session: AsyncSession = Depends(get_async_session),
+    email_service: EmailService = Depends(get_email_service)
 ):
     """Change user password"""
     try:
@@ -81,6 +85,8 @@ async def change_password(
                 user_agent=http_request.headers.get('User-Agent'),
                 success=False
             )
+            # Commit before raising: the session dependency rolls back on errors
+            await session.commit()
             raise HTTPException(status_code=400, detail="Incorrect current password")
 
         # Validate new password
@@ -94,7 +100,6 @@ async def change_password(
 
         # Update password
         current_user.hashed_password = pwd_context.hash(request.new_password)
-        await session.commit()
 
         # Log successful change
         audit_service = AuditService(session)
@@ -107,10 +112,11 @@ async def change_password(
             user_agent=http_request.headers.get('User-Agent'),
             success=True
         )
+        # Password update and its audit entry commit together
+        await session.commit()
 
         # Send security notification email
         try:
-            email_service = EmailService()
             await email_service.send_security_alert(
                 current_user.email,
                 "Password Changed",
@@ -145,12 +151,12 @@ async def check_password_strength(request: PasswordStrengthRequest):
 async def request_password_reset(
     request: PasswordResetRequest,
     http_request: Request,
-    session: AsyncSession = Depends(get_async_session)
+    session: AsyncSession = Depends(get_async_session),
+    email_service: EmailService = Depends(get_email_service)
 ):
     """Request password reset"""
     try:
         # Find user by email
-        from sqlalchemy import select
         result = await session.execute(select(User).filter(User.email == request.email))
         user = result.scalar_one_or_none()
 
@@ -159,16 +165,13 @@ async def request_password_reset(
         
         if user:
             # Generate reset token
-            import secrets
             token = secrets.token_urlsafe(32)
             
             # Store token (in production, store this in database with expiration)
             # For now, we'll use a simple in-memory store
-            from app.core.config import settings
             # TODO: Implement proper token storage with Redis or database
             
             # Send reset email
-            email_service = EmailService()
             reset_url = f"{settings.frontend_url}/reset-password?token={token}"
             await email_service.send_password_reset(user.email, reset_url)
             
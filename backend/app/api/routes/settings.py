@@ -1,7 +1,9 @@
 """Settings API endpoints for PowerDNS configuration management"""
 
 import asyncio
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
 from typing import List, Union, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -19,7 +21,8 @@ from app.schemas.settings import (
     PowerDNSHealthSummary,
     VersioningSettingsCreate,
     VersioningSettingsUpdate,
-    VersioningSettings
+    VersioningSettings,
+    POWERDNS_PUBLIC_LIST_ADAPTER
 )
 from app.services.settings import PowerDNSSettingsService, versioning_settings_service
 
@@ -50,7 +53,10 @@ async def get_powerdns_health(
 ):
     """Get real-time health status of all PowerDNS servers (admin only)"""
     settings_service = PowerDNSSettingsService()
-    return await settings_service.get_servers_health_status(session, quick_check)
+    summary = await settings_service.get_servers_health_status(session, quick_check)
+    # Polled frequently: serialize the already-validated summary in pydantic-core
+    # instead of re-validating it against response_model (kept for the OpenAPI schema)
+    return Response(content=summary.model_dump_json(), media_type="application/json")
 
 
 @router.get("/powerdns/{setting_id}/health")
@@ -66,13 +72,13 @@ async def get_powerdns_server_health(
         raise HTTPException(status_code=404, detail="PowerDNS setting not found")
     
     health = await settings_service.check_server_health(setting, quick_check=False)
-    return {
+    return ORJSONResponse({
         "server_id": setting.id,
         "name": setting.name,
         "api_url": setting.api_url,
         "is_active": setting.is_active,
         **health
-    }
+    })
 
 
 @router.get("/powerdns", response_model=List[PowerDNSSettingPublic])
@@ -122,16 +128,15 @@ async def get_powerdns_settings(
         if i < len(health_data):
             health = health_data[i]
             if not isinstance(health, Exception):
-                from datetime import datetime
                 setting_dict.update({
                     "health_status": health["status"],
                     "last_health_check": datetime.utcnow(),
                     "health_response_time_ms": health["response_time_ms"]
                 })
         
-        enhanced_settings.append(PowerDNSSettingPublic(**setting_dict))
+        enhanced_settings.append(setting_dict)
     
-    return enhanced_settings
+    return POWERDNS_PUBLIC_LIST_ADAPTER.validate_python(enhanced_settings)
 
 
 @router.get("/powerdns/{setting_id}", response_model=PowerDNSSettingPublic)
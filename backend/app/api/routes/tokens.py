@@ -1,6 +1,6 @@
 """API Token management routes"""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 from typing import List
@@ -9,7 +9,7 @@ from datetime import datetime, timedelta
 from app.core.auth import current_active_user
 from app.core.database import get_async_session
 from app.models.user import User, APIToken
-from app.schemas.tokens import APITokenCreate, APITokenRead, APITokenResponse
+from app.schemas.tokens import APITokenCreate, APITokenRead, APITokenResponse, API_TOKEN_LIST_ADAPTER
 
 router = APIRouter()
 
@@ -27,19 +27,12 @@ async def list_api_tokens(
     )
     tokens = result.scalars().all()
     
-    return [
-        APITokenRead(
-            id=token.id,
-            name=token.name,
-            description=token.description,
-            token_preview=token.token_preview,
-            created_at=token.created_at,
-            last_used_at=token.last_used_at,
-            expires_at=token.expires_at,
-            is_active=token.is_active
-        )
-        for token in tokens
-    ]
+    # Returning the models would make FastAPI dump and re-validate them against
+    # response_model; serialize the unvalidated rows directly instead
+    return Response(
+        content=API_TOKEN_LIST_ADAPTER.dump_json([APITokenRead.from_orm_trusted(token) for token in tokens]),
+        media_type="application/json"
+    )
 
 
 @router.post("/", response_model=APITokenResponse)
@@ -121,16 +114,7 @@ async def get_api_token(
             detail="API token not found"
         )
     
-    return APITokenRead(
-        id=token.id,
-        name=token.name,
-        description=token.description,
-        token_preview=token.token_preview,
-        created_at=token.created_at,
-        last_used_at=token.last_used_at,
-        expires_at=token.expires_at,
-        is_active=token.is_active
-    )
+    return Response(content=APITokenRead.from_orm_trusted(token).model_dump_json(), media_type="application/json")
 
 
 @router.patch("/{token_id}", response_model=APITokenRead)
@@ -1,5 +1,6 @@
 """Zone management routes"""
 
+import logging
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
@@ -12,6 +13,8 @@ from app.schemas.dns import ZoneCreate, ZoneRead
 from app.services.powerdns import PowerDNSClient, PowerDNSZone
 from app.services.multi_powerdns import multi_powerdns_service
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
@@ -76,8 +79,6 @@ async def get_zones(
         
     except Exception as e:
         # Log the error but return empty list if PowerDNS is not configured
-        import logging
-        logger = logging.getLogger(__name__)
         logger.warning(f"Failed to fetch zones (PowerDNS may not be configured): {str(e)}")
         return []
 
@@ -152,8 +153,8 @@ async def create_zone(
             )
         elif result.is_partial_success:
             # Some servers succeeded, some failed
-            success_servers = [r["server_name"] for r in result.results if r["success"]]
-            failed_servers = [f"{r['server_name']}: {r['error']}" for r in result.results if not r["success"]]
+            success_servers = [r.server_name for r in result.results if r.success]
+            failed_servers = [f"{r.server_name}: {r.error}" for r in result.results if not r.success]
             
             raise HTTPException(
                 status_code=status.HTTP_207_MULTI_STATUS,
@@ -172,7 +173,7 @@ async def create_zone(
             )
         else:
             # All servers failed
-            error_details = [f"{r['server_name']}: {r['error']}" for r in result.results]
+            error_details = [f"{r.server_name}: {r.error}" for r in result.results]
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
@@ -215,8 +216,8 @@ async def delete_zone(
             return {"message": f"Zone {zone_name} deleted successfully from all servers"}
         elif result.is_partial_success:
             # Some servers succeeded, some failed
-            success_servers = [r["server_name"] for r in result.results if r["success"]]
-            failed_servers = [f"{r['server_name']}: {r['error']}" for r in result.results if not r["success"]]
+            success_servers = [r.server_name for r in result.results if r.success]
+            failed_servers = [f"{r.server_name}: {r.error}" for r in result.results if not r.success]
             
             raise HTTPException(
                 status_code=status.HTTP_207_MULTI_STATUS,
@@ -229,7 +230,7 @@ async def delete_zone(
             )
         else:
             # All servers failed
-            error_details = [f"{r['server_name']}: {r['error']}" for r in result.results]
+            error_details = [f"{r.server_name}: {r.error}" for r in result.results]
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
@@ -1,7 +1,7 @@
 """Enhanced application configuration with comprehensive settings management"""
 
-from pydantic_settings import BaseSettings
-from pydantic import Field, validator, model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field, field_validator, model_validator
 from typing import Optional, List, Dict, Any, Union
 import os
 import secrets
@@ -52,13 +52,17 @@ class Settings(BaseSettings):
     # Monitoring
     slow_query_threshold_ms: float = Field(default=1000.0, description="Slow query threshold")
     
+    # Audit logs
+    audit_log_retention_days: int = Field(default=0, ge=0, description="Drop audit log months older than this many days on PostgreSQL (0 keeps everything)")
+    
     # Email
     email_enabled: bool = Field(default=False, description="Enable email")
     
     # Rate limiting
     rate_limit_enabled: bool = Field(default=True, description="Enable rate limiting")
     
-    @validator('cors_origins', pre=True)
+    @field_validator('cors_origins', mode='before')
+    @classmethod
     def parse_cors_origins(cls, v):
         """Parse CORS origins from string or list"""
         if isinstance(v, str):
@@ -67,8 +71,9 @@ class Settings(BaseSettings):
             return [origin.strip() for origin in v.split(",") if origin.strip()]
         return v
     
-    @validator('environment')
-    def validate_environment(cls, v):
+    @field_validator('environment')
+    @classmethod
+    def validate_environment(cls, v: str) -> str:
         valid_envs = ["development", "staging", "production"]
         if v not in valid_envs:
             raise ValueError(f"Environment must be one of: {valid_envs}")
@@ -87,9 +92,7 @@ class Settings(BaseSettings):
             return [origin.strip() for origin in self.cors_origins.split(",")]
         return self.cors_origins
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False)
 
 
 # Global settings instance
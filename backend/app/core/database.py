@@ -1,13 +1,26 @@
 """Database configuration and setup"""
 
 import logging
+import zlib
 from contextlib import asynccontextmanager
+import orjson
+from sqlalchemy import JSON, LargeBinary
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.pool import StaticPool
-from typing import AsyncGenerator
+from sqlalchemy.types import TypeDecorator
+from typing import AsyncGenerator, Optional
 from app.core.config import settings
 
+# Import zstandard with error handling; zlib is used when it is missing
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+    zstandard = None
+
 logger = logging.getLogger(__name__)
 
 # Create async database URL
@@ -17,11 +30,19 @@ if database_url.startswith("sqlite://"):
 elif database_url.startswith("postgresql://"):
     database_url = database_url.replace("postgresql://", "postgresql+asyncpg://")
 
+def json_dumps(obj) -> str:
+    """Serialize a JSON column value with orjson"""
+    return orjson.dumps(obj).decode()
+
+
 # Enhanced engine configuration with optimized settings
 engine_kwargs = {
     "echo": settings.environment == "development",
     "future": True,
     "pool_pre_ping": True,  # Verify connections before use
+    # orjson for JSON/JSONB columns instead of the stdlib json module
+    "json_serializer": json_dumps,
+    "json_deserializer": orjson.loads,
 }
 
 # SQLite-specific optimizations
@@ -55,12 +76,77 @@ async_session_maker = async_sessionmaker(
     autocommit=False
 )
 
+# Audit writes get their own small pool on PostgreSQL so bursts of batched
+# inserts cannot starve request queries of connections. SQLite has a single
+# shared connection, so there the main engine is reused.
+if "postgresql" in database_url:
+    audit_engine = create_async_engine(
+        database_url,
+        echo=False,
+        future=True,
+        pool_pre_ping=False,  # Short-lived write-only sessions; a failed batch is logged
+        pool_size=4,
+        max_overflow=8,
+        pool_timeout=30,
+        pool_recycle=3600,
+        json_serializer=json_dumps,
+        json_deserializer=orjson.loads,
+    )
+else:
+    audit_engine = engine
+
+audit_session_maker = async_sessionmaker(
+    audit_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False
+)
+
 
 class Base(DeclarativeBase):
     """Enhanced base class for all models"""
     pass
 
 
+# JSON column type: binary JSONB on PostgreSQL, plain JSON elsewhere (SQLite)
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
+
+# Every zstd frame starts with this magic number; zlib streams never do
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_zstd_compressor = zstandard.ZstdCompressor(level=3) if ZSTD_AVAILABLE else None
+_zstd_decompressor = zstandard.ZstdDecompressor() if ZSTD_AVAILABLE else None
+
+
+def compress_json(obj) -> bytes:
+    """Serialize a value to JSON and compress it (zstd, or zlib without zstandard)"""
+    data = orjson.dumps(obj)
+    if _zstd_compressor is not None:
+        return _zstd_compressor.compress(data)
+    return zlib.compress(data, 6)
+
+
+def decompress_json(blob: bytes):
+    """Inverse of compress_json; the codec is detected from the payload"""
+    if blob[:4] == _ZSTD_MAGIC:
+        if _zstd_decompressor is None:
+            raise RuntimeError("zstd-compressed data found but zstandard is not installed")
+        return orjson.loads(_zstd_decompressor.decompress(blob))
+    return orjson.loads(zlib.decompress(blob))
+
+
+class CompressedJSON(TypeDecorator):
+    """JSON document stored as a compressed binary blob"""
+    impl = LargeBinary
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect) -> Optional[bytes]:
+        return compress_json(value) if value is not None else None
+    
+    def process_result_value(self, value: Optional[bytes], dialect):
+        return decompress_json(value) if value is not None else None
+
+
 async def create_db_and_tables():
     """Create database tables with proper error handling"""
     try:
@@ -1,18 +1,24 @@
 """Enhanced structured logging configuration with performance monitoring"""
 
+import atexit
 import logging
 import logging.config
 import logging.handlers
-import json
+import decimal
+import queue
 import sys
+import threading
 import time
 from datetime import datetime
 from typing import Any, Dict, Optional, Union
 import traceback
 import uuid
 from contextvars import ContextVar
+from functools import lru_cache
 from pathlib import Path
 
+import orjson
+
 # Use try-catch for settings import to handle circular dependencies
 try:
     from app.core.config import settings
@@ -25,6 +31,35 @@ user_id_context: ContextVar[Optional[int]] = ContextVar('user_id', default=None)
 operation_context: ContextVar[Optional[str]] = ContextVar('operation', default=None)
 
 
+class _LazyTraceback:
+    """Defers traceback formatting until the serializer actually renders it"""
+    
+    __slots__ = ("record",)
+    
+    def __init__(self, record: logging.LogRecord):
+        self.record = record
+    
+    def __str__(self) -> str:
+        # Cache on the record like logging.Formatter does, so other handlers reuse it
+        record = self.record
+        if not record.exc_text:
+            record.exc_text = "".join(traceback.format_exception(*record.exc_info)).rstrip("\n")
+        return record.exc_text
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize the few non-native types that end up in log records"""
+    if isinstance(obj, _LazyTraceback):
+        return str(obj)
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, BaseException):
+        return str(obj)
+    raise TypeError
+
+
 class EnhancedStructuredFormatter(logging.Formatter):
     """Enhanced formatter for structured JSON logging with additional context"""
     
@@ -35,7 +70,7 @@ class EnhancedStructuredFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         # Create base log structure
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": datetime.utcfromtimestamp(record.created).isoformat() + "Z",
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -47,28 +82,122 @@ class EnhancedStructuredFormatter(logging.Formatter):
             "environment": settings.environment if settings else "development",
         }
         
-        # Add request context if available
-        request_id = request_id_context.get()
+        # Add request context if available; queued records carry a snapshot
+        # because they are formatted on the listener thread
+        context = getattr(record, "request_context", None)
+        if context is None:
+            context = (request_id_context.get(), user_id_context.get(), operation_context.get())
+        request_id, user_id, operation = context
         if request_id:
             log_entry["request_id"] = request_id
         
-        user_id = user_id_context.get()
         if user_id:
             log_entry["user_id"] = user_id
         
-        operation = operation_context.get()
         if operation:
             log_entry["operation"] = operation
         
         # Add exception information if present
-        if record.exc_info:
+        exc_info = record.exc_info
+        if exc_info:
+            exc_type, exc_value, _ = exc_info
             log_entry["exception"] = {
-                "type": record.exc_info[0].__name__ if record.exc_info[0] else None,
-                "message": str(record.exc_info[1]) if record.exc_info[1] else None,
-                "traceback": traceback.format_exception(*record.exc_info)
+                "type": exc_type.__name__ if exc_type else None,
+                "message": str(exc_value) if exc_value else None,
+                "traceback": record.exc_text or _LazyTraceback(record)
             }
         
-        return json.dumps(log_entry, default=str, ensure_ascii=False)
+        try:
+            return orjson.dumps(log_entry, default=_orjson_default).decode()
+        except TypeError:
+            # Unexpected payload type: degrade to str() rather than dropping the record
+            return orjson.dumps(log_entry, default=str).decode()
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that batches writes and flushes on a short interval
+    
+    StreamHandler flushes after every record, which makes heavy logging
+    syscall-bound. Records are instead written into a large buffer that a
+    background thread flushes every ``flush_interval`` seconds; at most that
+    window of output can be lost on a hard crash.
+    """
+    
+    def __init__(
+        self,
+        filename: str,
+        mode: str = "a",
+        encoding: Optional[str] = "utf-8",
+        buffer_size: int = 1 << 16,
+        flush_interval: float = 0.1
+    ):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        super().__init__(filename, mode=mode, encoding=encoding)
+        
+        self._flush_stop = threading.Event()
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop,
+            name="log-file-flush",
+            daemon=True
+        )
+        self._flush_thread.start()
+    
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors
+        )
+    
+    def emit(self, record: logging.LogRecord):
+        # Same as StreamHandler.emit without the per-record flush
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def _flush_loop(self):
+        while not self._flush_stop.wait(self.flush_interval):
+            self.flush()
+    
+    def close(self):
+        self._flush_stop.set()
+        super().close()
+
+
+class ContextQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that hands records to a listener thread without blocking
+    
+    Records are enqueued with their message resolved and the request context
+    captured, so formatting and I/O happen off the event loop. When the queue
+    is full the record is dropped rather than stalling the caller.
+    """
+    
+    def __init__(self, queue: "queue.Queue"):
+        super().__init__(queue)
+        self.dropped = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.request_context = (request_id_context.get(), user_id_context.get(), operation_context.get())
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_queue_listener: Optional[logging.handlers.QueueListener] = None
 
 
 def setup_logging():
@@ -94,6 +223,10 @@ def setup_logging():
     root_logger.setLevel(log_level)
     
     # Remove existing handlers
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
     
@@ -102,7 +235,21 @@ def setup_logging():
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
     
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
+    
+    # Optional file output
+    if settings and settings.log_file:
+        Path(settings.log_file).parent.mkdir(parents=True, exist_ok=True)
+        file_handler = BufferedFileHandler(settings.log_file)
+        file_handler.setLevel(log_level)
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+    
+    # Emit through a bounded queue so callers never block on formatting or I/O
+    log_queue: queue.Queue = queue.Queue(maxsize=10000)
+    _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+    root_logger.addHandler(ContextQueueHandler(log_queue))
     
     # Set specific logger levels
     logger_levels = {
@@ -121,13 +268,105 @@ def setup_logging():
     logger.info("Logging configured successfully")
 
 
+@atexit.register
+def _stop_queue_listener():
+    """Drain queued records on interpreter shutdown"""
+    if _queue_listener is not None:
+        _queue_listener.stop()
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the specified name"""
     return logging.getLogger(name)
 
 
-# Convenience request logger
-request_logger = get_logger("app.request")
+class RequestLogger:
+    """Structured logger for HTTP request lifecycle events"""
+    
+    def __init__(self):
+        self.logger = get_logger("app.request")
+    
+    def log_request_start(
+        self,
+        request_id: str,
+        method: str,
+        path: str,
+        query_params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        ip_address: Optional[str] = None
+    ):
+        """Log the start of an HTTP request"""
+        self.logger.info(
+            f"Request started: {method} {path}",
+            extra={
+                "event_data": {
+                    "event_type": "request_start",
+                    "request_id": request_id,
+                    "method": method,
+                    "path": path,
+                    "query_params": query_params,
+                    "user_agent": headers.get("user-agent") if headers else None,
+                    "ip_address": ip_address
+                }
+            }
+        )
+    
+    def log_request(
+        self,
+        method: str,
+        path: str,
+        status_code: int,
+        duration_ms: float,
+        request_id: Optional[str] = None,
+        user_id: Optional[int] = None,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None
+    ):
+        """Log a completed HTTP request"""
+        if status_code >= 500:
+            level = logging.ERROR
+        elif status_code >= 400:
+            level = logging.WARNING
+        else:
+            level = logging.INFO
+        
+        # Called on every request: bail out before building anything if filtered
+        if not self.logger.isEnabledFor(level):
+            return
+        
+        event_data = {
+            "event_type": "http_request",
+            "method": method,
+            "path": path,
+            "status_code": status_code,
+            "duration_ms": duration_ms
+        }
+        # Only emit optional fields that are actually set
+        if request_id is not None:
+            event_data["request_id"] = request_id
+        if user_id is not None:
+            event_data["user_id"] = user_id
+        if ip_address is not None:
+            event_data["ip_address"] = ip_address
+        if user_agent is not None:
+            event_data["user_agent"] = user_agent
+        
+        self.logger.log(
+            level,
+            "%s %s %d in %.2fms",
+            method,
+            path,
+            status_code,
+            duration_ms,
+            extra={"event_data": event_data}
+        )
+
+
+# Lazily constructed so setup_logging() has configured handlers before first use
+@lru_cache(maxsize=None)
+def request_logger() -> RequestLogger:
+    """Get the shared request logger"""
+    return RequestLogger()
 
 
 # Context management functions
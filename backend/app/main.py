@@ -2,11 +2,11 @@
 
 import logging
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Depends, Request
+from fastapi import APIRouter, FastAPI, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.security import HTTPBearer
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from typing import Union
 
 from app.core.config import settings
@@ -15,8 +15,11 @@ from app.core.auth import current_active_user
 from app.core.logging import setup_logging, request_logger
 from app.services.token_auth import get_current_api_user
 from app.middleware.rate_limit import RateLimitMiddleware
-from app.middleware.monitoring import EnhancedMonitoringMiddleware, health_monitor
+from app.middleware.monitoring import EnhancedMonitoringMiddleware, health_monitor, request_metrics
 from app.models.user import User
+from app.models.audit import audit_log_buffer, audit_partition_maintenance
+from app.services.multi_powerdns import multi_powerdns_service
+from app.services.powerdns import close_shared_http_clients
 
 # Import API routes
 from app.api.routes import auth, zones, records, users, tokens, versioning, security
@@ -42,6 +45,20 @@ async def lifespan(app: FastAPI):
         # Register health checks
         health_monitor.register_health_check("database", db_health_check)
         
+        # Make sure upcoming monthly audit partitions exist (PostgreSQL only),
+        # then keep them ahead of the clock and apply retention periodically
+        await audit_partition_maintenance.run_once()
+        audit_partition_maintenance.start()
+        
+        # Start batched audit log writes
+        audit_log_buffer.start()
+        
+        # Refresh the per-endpoint request metrics off the request path
+        request_metrics.start_aggregator()
+        
+        # Keep the PowerDNS settings snapshot fresh off the request path
+        multi_powerdns_service.start_settings_refresh()
+        
         logger.info("DNSMate API server started successfully")
         yield
     except Exception as e:
@@ -50,71 +67,16 @@ async def lifespan(app: FastAPI):
     finally:
         # Shutdown
         logger.info("Shutting down DNSMate API server...")
+        await audit_log_buffer.stop()
+        await request_metrics.stop_aggregator()
+        await audit_partition_maintenance.stop()
+        await multi_powerdns_service.close()
+        await close_shared_http_clients()
 
 
-# Create FastAPI application with enhanced configuration
-app = FastAPI(
-    title="DNSMate API - Enhanced Edition",
-    description="Advanced DNS Management API for PowerDNS with multi-server support, monitoring, and enterprise features",
-    version="1.1.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
-    lifespan=lifespan,
-    # Enhanced OpenAPI configuration
-    openapi_tags=[
-        {"name": "authentication", "description": "User authentication and authorization"},
-        {"name": "zones", "description": "DNS zone management operations"},
-        {"name": "records", "description": "DNS record management operations"},
-        {"name": "users", "description": "User management and permissions"},
-        {"name": "api-tokens", "description": "API token management"},
-        {"name": "settings", "description": "System and PowerDNS configuration"},
-        {"name": "versioning", "description": "Zone versioning and rollback"},
-        {"name": "backup", "description": "Zone backup and export"},
-        {"name": "security", "description": "Security and audit features"},
-        {"name": "monitoring", "description": "Health checks and metrics"},
-    ]
-)
-
-# Security: Trusted host middleware (for production)
-if settings.environment == "production":
-    app.add_middleware(
-        TrustedHostMiddleware, 
-        allowed_hosts=["*.dnsmate.com", "localhost", "127.0.0.1"]
-    )
-
-# Enhanced CORS configuration
-cors_origins = ["*"] if settings.environment == "development" else [
-    "https://dnsmate.com",
-    "https://app.dnsmate.com",
-    "http://localhost:3000",  # Development frontend
-    "http://localhost:3001",  # Alternative dev port
-]
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=cors_origins,
-    allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
-    allow_headers=["*"],
-    expose_headers=["X-Request-ID", "X-Response-Time"]
-)
-
-# Enhanced monitoring middleware (temporarily disabled for debugging)
-# app.add_middleware(
-#     EnhancedMonitoringMiddleware,
-#     enable_detailed_logging=(settings.environment == "development")
-# )
-
-# Rate limiting middleware (enabled in production)
-if settings.environment == "production":
-    app.add_middleware(RateLimitMiddleware)
-
-# Global exception handler
-@app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception):
-    """Global exception handler for unhandled errors"""
-    request_id = getattr(request.state, "request_id", "unknown")
-    
+# Global exception handlers
+def _unhandled_error_response(request: Request, exc: Exception, request_id: str) -> ORJSONResponse:
+    """Log an unhandled error and build the generic 500 response"""
     logger.error(
         f"Unhandled exception: {exc}",
         extra={
@@ -126,7 +88,7 @@ async def global_exception_handler(request: Request, exc: Exception):
         exc_info=True
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
@@ -137,6 +99,18 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
+async def global_exception_handler(request: Request, exc: Exception):
+    """Global exception handler for unhandled errors (monitoring middleware installed)"""
+    # Excluded paths never get a request ID, so the lookup must stay tolerant
+    request_id = getattr(request.state, "request_id", "unknown")
+    return _unhandled_error_response(request, exc, request_id)
+
+
+async def global_exception_handler_unmonitored(request: Request, exc: Exception):
+    """Global exception handler for unhandled errors (no request IDs are assigned)"""
+    return _unhandled_error_response(request, exc, "unknown")
+
+
 # Enhanced dual authentication dependency
 async def get_current_user(
     jwt_user: User = Depends(current_active_user),
@@ -146,19 +120,11 @@ async def get_current_user(
     return jwt_user or api_user
 
 
-# Include API routers with enhanced organization
-app.include_router(auth.router, prefix="/auth", tags=["authentication"])
-app.include_router(monitoring.router, prefix="/api", tags=["monitoring"])
-app.include_router(security.router, prefix="/api", tags=["security"])
-app.include_router(settings_routes.router, prefix="/api/settings", tags=["settings"])
-app.include_router(zones.router, prefix="/api/zones", tags=["zones"])
-app.include_router(records.router, prefix="/api/records", tags=["records"])
-app.include_router(users.router, prefix="/api/users", tags=["users"])
-app.include_router(tokens.router, prefix="/api/tokens", tags=["api-tokens"])
-app.include_router(versioning.router, prefix="/api/zones", tags=["versioning", "backup"])
+# Top-level informational endpoints
+root_router = APIRouter()
 
 
-@app.get("/", tags=["health"])
+@root_router.get("/", tags=["health"])
 async def root():
     """Enhanced root endpoint with system information"""
     return {
@@ -189,7 +155,7 @@ async def root():
     }
 
 
-@app.get("/api/info", tags=["health"])
+@root_router.get("/api/info", tags=["health"])
 async def api_info():
     """API information and capabilities"""
     return {
@@ -214,3 +180,89 @@ async def api_info():
             "token_expiry": "configurable"
         }
     }
+
+
+def create_app() -> FastAPI:
+    """Build the FastAPI application, specialized for the configured environment"""
+    is_production = settings.environment == "production"
+    has_monitoring = is_production
+    
+    # Create FastAPI application with enhanced configuration
+    app = FastAPI(
+        title="DNSMate API - Enhanced Edition",
+        description="Advanced DNS Management API for PowerDNS with multi-server support, monitoring, and enterprise features",
+        version="1.1.0",
+        docs_url="/docs",
+        redoc_url="/redoc",
+        lifespan=lifespan,
+        # orjson-backed responses for every endpoint, including error paths
+        default_response_class=ORJSONResponse,
+        # Enhanced OpenAPI configuration
+        openapi_tags=[
+            {"name": "authentication", "description": "User authentication and authorization"},
+            {"name": "zones", "description": "DNS zone management operations"},
+            {"name": "records", "description": "DNS record management operations"},
+            {"name": "users", "description": "User management and permissions"},
+            {"name": "api-tokens", "description": "API token management"},
+            {"name": "settings", "description": "System and PowerDNS configuration"},
+            {"name": "versioning", "description": "Zone versioning and rollback"},
+            {"name": "backup", "description": "Zone backup and export"},
+            {"name": "security", "description": "Security and audit features"},
+            {"name": "monitoring", "description": "Health checks and metrics"},
+        ]
+    )
+    
+    # Security: Trusted host middleware (for production)
+    if is_production:
+        app.add_middleware(
+            TrustedHostMiddleware, 
+            allowed_hosts=["*.dnsmate.com", "localhost", "127.0.0.1"]
+        )
+    
+    # Enhanced CORS configuration
+    cors_origins = ["*"] if settings.environment == "development" else [
+        "https://dnsmate.com",
+        "https://app.dnsmate.com",
+        "http://localhost:3000",  # Development frontend
+        "http://localhost:3001",  # Alternative dev port
+    ]
+    
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=cors_origins,
+        allow_credentials=True,
+        allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
+        allow_headers=["*"],
+        expose_headers=["X-Request-ID", "X-Response-Time"]
+    )
+    
+    # Enhanced monitoring middleware (assigns request IDs)
+    if has_monitoring:
+        app.add_middleware(EnhancedMonitoringMiddleware, enable_detailed_logging=False)
+    
+    # Rate limiting middleware (enabled in production)
+    if is_production:
+        app.add_middleware(RateLimitMiddleware)
+    
+    # Bind the handler matching the middleware stack instead of probing per error
+    app.add_exception_handler(
+        Exception,
+        global_exception_handler if has_monitoring else global_exception_handler_unmonitored
+    )
+    
+    # Include API routers with enhanced organization
+    app.include_router(root_router)
+    app.include_router(auth.router, prefix="/auth", tags=["authentication"])
+    app.include_router(monitoring.router, prefix="/api", tags=["monitoring"])
+    app.include_router(security.router, prefix="/api", tags=["security"])
+    app.include_router(settings_routes.router, prefix="/api/settings", tags=["settings"])
+    app.include_router(zones.router, prefix="/api/zones", tags=["zones"])
+    app.include_router(records.router, prefix="/api/records", tags=["records"])
+    app.include_router(users.router, prefix="/api/users", tags=["users"])
+    app.include_router(tokens.router, prefix="/api/tokens", tags=["api-tokens"])
+    app.include_router(versioning.router, prefix="/api/zones", tags=["versioning", "backup"])
+    
+    return app
+
+
+app = create_app()
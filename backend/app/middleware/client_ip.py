@@ -0,0 +1,20 @@
+"""Client IP extraction shared by the middlewares"""
+
+from typing import Optional
+
+from starlette.datastructures import Address, Headers
+
+# Reverse proxy headers in order of precedence
+_IP_HEADERS = ("x-forwarded-for", "x-real-ip")
+
+
+def extract_client_ip(headers: Headers, client: Optional[Address]) -> str:
+    """Extract client IP address, honouring reverse proxy headers"""
+    for header in _IP_HEADERS:
+        value = headers.get(header)
+        if value:
+            # X-Forwarded-For lists the original client first
+            return value.partition(",")[0].strip()
+    
+    # Fallback to direct connection
+    return client.host if client else "unknown"
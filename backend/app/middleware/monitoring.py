@@ -1,88 +1,161 @@
 """Enhanced monitoring and error tracking middleware"""
 
+import os
+import re
 import time
+import asyncio
 import logging
-from typing import Callable, Dict, Any, Optional
+from array import array
+from collections import deque
+from functools import lru_cache
+from typing import Callable, Deque, Dict, Any, List, Optional, Tuple
 from fastapi import Request, Response
+from starlette.datastructures import Address, Headers
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
 import json
-import uuid
 from contextlib import asynccontextmanager
 
 from app.core.logging import request_logger, set_request_context, clear_request_context
+from app.middleware.client_ip import extract_client_ip
 
 logger = logging.getLogger(__name__)
 
 
+def _rt_header(ns: int) -> str:
+    """Format a duration in nanoseconds for the X-Response-Time header"""
+    return f"{ns / 1e6:.2f}ms"
+
+
 class RequestMetrics:
     """In-memory request metrics collection"""
     
-    def __init__(self):
+    def __init__(self, aggregate_interval: float = 5.0):
         self.request_count = 0
         self.error_count = 0
-        self.total_response_time = 0.0
+        self.total_response_ns = 0
+        # Raw per-endpoint counters as parallel arrays indexed by endpoint id
+        self._slot_ids: Dict[Tuple[str, int], int] = {}
+        self._counts = array("q")
+        self._errors = array("q")
+        self._total_ns = array("q")
+        self._min_ns = array("q")
+        self._max_ns = array("q")
+        # Aggregated view, refreshed off the request path
         self.endpoint_metrics: Dict[str, Dict[str, Any]] = {}
-        self.recent_errors: list = []
+        self.recent_errors: Deque[Dict[str, Any]] = deque(maxlen=100)
+        # Short tail reported by get_summary without copying all 100
+        self._latest_errors: Deque[Dict[str, Any]] = deque(maxlen=10)
+        self.aggregate_interval = aggregate_interval
+        self._aggregator_task: Optional[asyncio.Task] = None
     
-    def record_request(self, endpoint: str, method: str, status_code: int, response_time: float):
+    def record_request(self, endpoint_id: int, method: str, status_code: int, response_ns: int):
         """Record request metrics"""
         self.request_count += 1
-        self.total_response_time += response_time
-        
-        if status_code >= 400:
-            self.error_count += 1
+        self.total_response_ns += response_ns
         
         # Track per-endpoint metrics
-        key = f"{method} {endpoint}"
-        if key not in self.endpoint_metrics:
-            self.endpoint_metrics[key] = {
-                "count": 0,
-                "errors": 0,
-                "total_time": 0.0,
-                "avg_time": 0.0,
-                "min_time": float('inf'),
-                "max_time": 0.0
-            }
+        key = (method, endpoint_id)
+        i = self._slot_ids.get(key)
+        if i is None:
+            i = self._intern(key, response_ns)
         
-        metrics = self.endpoint_metrics[key]
-        metrics["count"] += 1
-        metrics["total_time"] += response_time
-        metrics["avg_time"] = metrics["total_time"] / metrics["count"]
-        metrics["min_time"] = min(metrics["min_time"], response_time)
-        metrics["max_time"] = max(metrics["max_time"], response_time)
+        self._counts[i] += 1
+        self._total_ns[i] += response_ns
+        if response_ns < self._min_ns[i]:
+            self._min_ns[i] = response_ns
+        elif response_ns > self._max_ns[i]:
+            self._max_ns[i] = response_ns
         
         if status_code >= 400:
-            metrics["errors"] += 1
+            self.error_count += 1
+            self._errors[i] += 1
+    
+    def _intern(self, key: Tuple[str, int], response_ns: int) -> int:
+        """Allocate a slot in the counter arrays for a new endpoint"""
+        i = len(self._counts)
+        self._counts.append(0)
+        self._errors.append(0)
+        self._total_ns.append(0)
+        self._min_ns.append(response_ns)
+        self._max_ns.append(response_ns)
+        self._slot_ids[key] = i
+        return i
     
     def record_error(self, error_details: Dict[str, Any]):
         """Record error details"""
         error_details["timestamp"] = time.time()
         self.recent_errors.append(error_details)
+        self._latest_errors.append(error_details)
+    
+    def aggregate(self):
+        """Snapshot the raw counters into the reported endpoint metrics"""
+        counts, total_ns = self._counts, self._total_ns
+        self.endpoint_metrics = {
+            f"{method} {_endpoint_patterns[endpoint_id]}": {
+                "count": counts[i],
+                "errors": self._errors[i],
+                "total_time": total_ns[i] / 1e9,
+                "avg_time": total_ns[i] / counts[i] / 1e9,
+                "min_time": self._min_ns[i] / 1e9,
+                "max_time": self._max_ns[i] / 1e9
+            }
+            for (method, endpoint_id), i in list(self._slot_ids.items())
+        }
+    
+    def start_aggregator(self):
+        """Start the background aggregation task on the running loop
         
-        # Keep only last 100 errors
-        if len(self.recent_errors) > 100:
-            self.recent_errors = self.recent_errors[-100:]
+        Until it runs (and after stop_aggregator) get_summary aggregates on demand.
+        """
+        if self._aggregator_task is not None and not self._aggregator_task.done():
+            return
+        self._aggregator_task = asyncio.get_running_loop().create_task(self._aggregate_loop())
+    
+    async def stop_aggregator(self):
+        """Cancel the background aggregation task"""
+        if self._aggregator_task is None:
+            return
+        self._aggregator_task.cancel()
+        try:
+            await self._aggregator_task
+        except asyncio.CancelledError:
+            pass
+        self._aggregator_task = None
+    
+    async def _aggregate_loop(self):
+        """Periodically refresh the aggregated endpoint metrics"""
+        while True:
+            await asyncio.sleep(self.aggregate_interval)
+            self.aggregate()
     
     def get_summary(self) -> Dict[str, Any]:
         """Get metrics summary"""
+        if self._aggregator_task is None or self._aggregator_task.done():
+            self.aggregate()
+        
+        # Snapshot the counters so the summary is internally consistent
+        request_count = self.request_count
+        error_count = self.error_count
+        total_response_ns = self.total_response_ns
+        
         avg_response_time = (
-            self.total_response_time / self.request_count 
-            if self.request_count > 0 else 0.0
+            total_response_ns / request_count / 1e9
+            if request_count > 0 else 0.0
         )
         
         error_rate = (
-            (self.error_count / self.request_count) * 100 
-            if self.request_count > 0 else 0.0
+            (error_count / request_count) * 100 
+            if request_count > 0 else 0.0
         )
         
         return {
-            "total_requests": self.request_count,
-            "total_errors": self.error_count,
+            "total_requests": request_count,
+            "total_errors": error_count,
             "error_rate_percent": round(error_rate, 2),
             "avg_response_time_ms": round(avg_response_time * 1000, 2),
             "endpoints": self.endpoint_metrics,
-            "recent_errors": self.recent_errors[-10:]  # Last 10 errors
+            "recent_errors": list(self._latest_errors)  # Last 10 errors
         }
 
 
@@ -98,13 +171,21 @@ class EnhancedMonitoringMiddleware(BaseHTTPMiddleware):
         self.enable_detailed_logging = enable_detailed_logging
         self.excluded_paths = {"/health", "/docs", "/redoc", "/openapi.json"}
     
+    async def __call__(self, scope, receive, send):
+        # Excluded paths bypass BaseHTTPMiddleware's request/stream wrapping entirely
+        if scope["type"] == "http" and scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+    
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Skip monitoring for excluded paths
-        if request.url.path in self.excluded_paths:
-            return await call_next(request)
+        path = request.url.path
+        
+        method = request.method
+        headers = request.headers
         
         # Generate request ID
-        request_id = str(uuid.uuid4())
+        request_id = os.urandom(16).hex()
         request.state.request_id = request_id
         
         # Extract user information if available
@@ -119,59 +200,61 @@ class EnhancedMonitoringMiddleware(BaseHTTPMiddleware):
         # Set request context for logging
         set_request_context(request_id, user_id)
         
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         
         try:
             # Log request start
             if self.enable_detailed_logging:
-                await self._log_request_start(request, request_id)
+                await self._log_request_start(request, method, path, headers, request_id)
             
             # Process request
             response = await call_next(request)
             
             # Calculate response time
-            response_time = time.time() - start_time
+            response_ns = time.monotonic_ns() - start_ns
+            response_time = response_ns / 1e9
             
             # Record metrics
             request_metrics.record_request(
-                endpoint=self._get_endpoint_pattern(request),
-                method=request.method,
+                endpoint_id=_endpoint_id(path),
+                method=method,
                 status_code=response.status_code,
-                response_time=response_time
+                response_ns=response_ns
             )
             
             # Log successful request
             if self.enable_detailed_logging:
-                await self._log_request_success(request, response, response_time, request_id)
+                await self._log_request_success(method, path, response, response_time, request_id)
             
             # Add monitoring headers
             response.headers["X-Request-ID"] = request_id
-            response.headers["X-Response-Time"] = f"{response_time * 1000:.2f}ms"
+            response.headers["X-Response-Time"] = _rt_header(response_ns)
             
             return response
             
         except Exception as e:
             # Calculate response time for errors
-            response_time = time.time() - start_time
+            response_ns = time.monotonic_ns() - start_ns
+            response_time = response_ns / 1e9
             
             # Record error metrics
             error_details = {
                 "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
+                "method": method,
+                "path": path,
                 "error": str(e),
                 "error_type": type(e).__name__,
                 "response_time": response_time,
                 "user_id": user_id,
-                "user_agent": request.headers.get("user-agent"),
-                "ip_address": self._get_client_ip(request)
+                "user_agent": headers.get("user-agent"),
+                "ip_address": self._get_client_ip(headers, request.client)
             }
             
             request_metrics.record_error(error_details)
             
             # Log error
             logger.error(
-                f"Request failed: {request.method} {request.url.path}",
+                f"Request failed: {method} {path}",
                 extra={
                     "request_id": request_id,
                     "error": str(e),
@@ -182,77 +265,91 @@ class EnhancedMonitoringMiddleware(BaseHTTPMiddleware):
             )
             
             # Return structured error response
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=500,
                 content={
                     "error": "Internal server error",
                     "request_id": request_id,
                     "timestamp": time.time()
-                },
-                headers={
-                    "X-Request-ID": request_id,
-                    "X-Response-Time": f"{response_time * 1000:.2f}ms"
                 }
             )
+            # Same in-place header writes as the success path; no separate headers dict
+            response.headers["X-Request-ID"] = request_id
+            response.headers["X-Response-Time"] = _rt_header(response_ns)
+            return response
         
         finally:
             # Clean up request context
             clear_request_context()
     
-    async def _log_request_start(self, request: Request, request_id: str):
+    async def _log_request_start(self, request: Request, method: str, path: str, headers: Headers, request_id: str):
         """Log request start details"""
-        request_logger.log_request_start(
+        request_logger().log_request_start(
             request_id=request_id,
-            method=request.method,
-            path=request.url.path,
+            method=method,
+            path=path,
             query_params=dict(request.query_params),
-            headers=dict(request.headers),
-            ip_address=self._get_client_ip(request)
+            headers=dict(headers),
+            ip_address=self._get_client_ip(headers, request.client)
         )
     
-    async def _log_request_success(self, request: Request, response: Response, response_time: float, request_id: str):
+    async def _log_request_success(self, method: str, path: str, response: Response, response_time: float, request_id: str):
         """Log successful request completion"""
-        request_logger.log_request_success(
-            request_id=request_id,
+        request_logger().log_request(
+            method=method,
+            path=path,
             status_code=response.status_code,
-            response_time=response_time,
-            response_headers=dict(response.headers)
+            duration_ms=round(response_time * 1000, 2),
+            request_id=request_id
         )
     
-    def _get_client_ip(self, request: Request) -> str:
+    def _get_client_ip(self, headers: Headers, client: Optional[Address]) -> str:
         """Extract client IP address"""
-        # Check for forwarded headers first
-        forwarded_for = request.headers.get("x-forwarded-for")
-        if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
-        
-        real_ip = request.headers.get("x-real-ip")
-        if real_ip:
-            return real_ip
-        
-        # Fallback to direct connection
-        if hasattr(request, "client") and request.client:
-            return request.client.host
-        
-        return "unknown"
+        return extract_client_ip(headers, client)
     
-    def _get_endpoint_pattern(self, request: Request) -> str:
+    def _get_endpoint_pattern(self, path: str) -> str:
         """Get endpoint pattern for metrics grouping"""
-        path = request.url.path
-        
-        # Group similar endpoints together
-        if path.startswith("/api/zones/") and len(path.split("/")) > 3:
-            return "/api/zones/{zone_name}"
-        elif path.startswith("/api/records/") and len(path.split("/")) > 3:
-            return "/api/records/{zone_name}"
-        elif path.startswith("/api/users/") and len(path.split("/")) > 3:
-            return "/api/users/{user_id}"
-        elif path.startswith("/api/tokens/") and len(path.split("/")) > 3:
-            return "/api/tokens/{token_id}"
-        elif path.startswith("/api/settings/powerdns/") and len(path.split("/")) > 4:
-            return "/api/settings/powerdns/{setting_id}"
-        
-        return path
+        return _endpoint_patterns[_endpoint_id(path)]
+
+
+# (prefix, pattern) used to group similar endpoints together
+_ENDPOINT_PREFIX_RULES = (
+    ("/api/zones/", "/api/zones/{zone_name}"),
+    ("/api/records/", "/api/records/{zone_name}"),
+    ("/api/users/", "/api/users/{user_id}"),
+    ("/api/tokens/", "/api/tokens/{token_id}"),
+    ("/api/settings/powerdns/", "/api/settings/powerdns/{setting_id}"),
+)
+
+# All prefixes fused into one alternation; the matching group number selects the pattern
+_ENDPOINT_PREFIX_RE = re.compile(
+    "|".join(f"({re.escape(prefix)})" for prefix, _ in _ENDPOINT_PREFIX_RULES)
+)
+_PATTERN_BY_GROUP = {i: pattern for i, (_, pattern) in enumerate(_ENDPOINT_PREFIX_RULES, start=1)}
+
+
+# Interned endpoint patterns; request metrics refer to them by index
+_endpoint_patterns: List[str] = []
+_endpoint_pattern_ids: Dict[str, int] = {}
+
+
+def _endpoint_pattern(path: str) -> str:
+    """Map a request path to its metrics grouping pattern"""
+    match = _ENDPOINT_PREFIX_RE.match(path)
+    if match:
+        return _PATTERN_BY_GROUP[match.lastindex]
+    return path
+
+
+@lru_cache(maxsize=4096)
+def _endpoint_id(path: str) -> int:
+    """Map a request path to the id of its interned grouping pattern"""
+    pattern = _endpoint_pattern(path)
+    pattern_id = _endpoint_pattern_ids.get(pattern)
+    if pattern_id is None:
+        pattern_id = _endpoint_pattern_ids[pattern] = len(_endpoint_patterns)
+        _endpoint_patterns.append(pattern)
+    return pattern_id
 
 
 class HealthCheckMonitor:
@@ -260,32 +357,40 @@ class HealthCheckMonitor:
     
     def __init__(self):
         self.start_time = time.time()
-        self.health_checks: Dict[str, Dict[str, Any]] = {}
+        self._start_ns = time.monotonic_ns()
+        self.health_checks: Dict[str, Callable] = {}
+        # Last results per check; replaced wholesale, never mutated in place
+        self.check_state: Dict[str, Dict[str, Any]] = {}
+    
+    def uptime_seconds(self) -> float:
+        """Seconds since startup, immune to wall-clock adjustments"""
+        return (time.monotonic_ns() - self._start_ns) / 1e9
     
     def register_health_check(self, name: str, check_func: Callable):
         """Register a health check function"""
-        self.health_checks[name] = {
-            "check_func": check_func,
-            "last_check": 0,
-            "last_status": "unknown",
-            "last_error": None
+        self.health_checks[name] = check_func
+        self.check_state = {
+            **self.check_state,
+            name: {"last_check": 0, "last_status": "unknown", "last_error": None}
         }
     
     async def run_health_checks(self) -> Dict[str, Any]:
         """Run all registered health checks"""
+        checks: Dict[str, Dict[str, Any]] = {}
+        new_state: Dict[str, Dict[str, Any]] = {}
         results = {
             "status": "healthy",
             "timestamp": time.time(),
-            "uptime_seconds": time.time() - self.start_time,
-            "checks": {},
+            "uptime_seconds": self.uptime_seconds(),
+            "checks": checks,
             "metrics": request_metrics.get_summary()
         }
         
         overall_healthy = True
         
-        for name, check_info in self.health_checks.items():
+        for name, check_func in list(self.health_checks.items()):
             try:
-                check_result = await check_info["check_func"]()
+                check_result = await check_func()
                 status = "healthy" if check_result else "unhealthy"
                 error = None
             except Exception as e:
@@ -293,20 +398,24 @@ class HealthCheckMonitor:
                 error = str(e)
                 overall_healthy = False
             
-            results["checks"][name] = {
+            now = time.time()
+            checks[name] = {
                 "status": status,
-                "timestamp": time.time(),
+                "timestamp": now,
                 "error": error
             }
-            
-            # Update stored info
-            check_info["last_check"] = time.time()
-            check_info["last_status"] = status
-            check_info["last_error"] = error
+            new_state[name] = {
+                "last_check": now,
+                "last_status": status,
+                "last_error": error
+            }
             
             if status != "healthy":
                 overall_healthy = False
         
+        # Publish the new results with a single reference swap
+        self.check_state = {**self.check_state, **new_state}
+        
         results["status"] = "healthy" if overall_healthy else "unhealthy"
         return results
 
@@ -321,7 +430,7 @@ async def get_application_metrics() -> Dict[str, Any]:
         "request_metrics": request_metrics.get_summary(),
         "health_status": await health_monitor.run_health_checks(),
         "system_info": {
-            "uptime_seconds": time.time() - health_monitor.start_time,
+            "uptime_seconds": health_monitor.uptime_seconds(),
             "timestamp": time.time()
         }
     }
@@ -2,7 +2,8 @@
 
 import time
 from typing import Dict, Optional, Tuple
-from collections import defaultdict
+from collections import deque
+from functools import lru_cache
 from fastapi import Request, HTTPException, status
 from starlette.middleware.base import BaseHTTPMiddleware
 from fastapi.responses import JSONResponse
@@ -13,11 +14,13 @@ import logging
 
 # Import redis with error handling
 try:
-    import redis
+    from redis import asyncio as aioredis
     REDIS_AVAILABLE = True
 except ImportError:
     REDIS_AVAILABLE = False
-    redis = None
+    aioredis = None
+
+from app.middleware.client_ip import extract_client_ip
 
 logger = logging.getLogger(__name__)
 
@@ -26,28 +29,49 @@ class InMemoryRateLimiter:
     """In-memory rate limiter for development/small deployments"""
     
     def __init__(self):
-        self.requests = defaultdict(list)
-        self.blocked_ips = defaultdict(float)  # IP -> timestamp when block expires
+        # key -> [per-second request counts (oldest first), running total, second of the last bucket, window]
+        self.requests: Dict[str, list] = {}
+        self.blocked_ips: Dict[str, float] = {}  # IP -> timestamp when block expires
+        self.gc_interval = 60
+        self._last_gc = 0.0
     
-    def is_allowed(self, key: str, limit: int, window: int) -> Tuple[bool, Dict[str, int]]:
+    async def is_allowed(self, key: str, limit: int, window: int) -> Tuple[bool, Dict[str, int]]:
         """Check if request is allowed within rate limit"""
         now = time.time()
         
+        if now - self._last_gc > self.gc_interval:
+            self._collect_expired(now)
+        
         # Check if IP is currently blocked
-        if key in self.blocked_ips and self.blocked_ips[key] > now:
-            remaining_block_time = int(self.blocked_ips[key] - now)
+        blocked_until = self.blocked_ips.get(key)
+        if blocked_until is not None and blocked_until > now:
+            remaining_block_time = int(blocked_until - now)
             return False, {
                 "allowed": limit,
                 "remaining": 0,
-                "reset_time": int(self.blocked_ips[key]),
+                "reset_time": int(blocked_until),
                 "blocked_for": remaining_block_time
             }
         
-        # Clean up old requests
-        self.requests[key] = [req_time for req_time in self.requests[key] if now - req_time < window]
+        # Slide the per-second buckets forward to the current second
+        now_sec = int(now)
+        entry = self.requests.get(key)
+        if entry is None:
+            entry = self.requests[key] = [deque([0]), 0, now_sec, window]
         
-        # Check rate limit
-        current_requests = len(self.requests[key])
+        buckets, current_requests, last_sec, _ = entry
+        elapsed = now_sec - last_sec
+        if elapsed >= window:
+            buckets.clear()
+            buckets.append(0)
+            current_requests = 0
+        else:
+            for _ in range(elapsed):
+                buckets.append(0)
+                if len(buckets) > window:
+                    current_requests -= buckets.popleft()
+        entry[1] = current_requests
+        entry[2] = now_sec
         
         if current_requests >= limit:
             # Block IP for extended period on repeated violations
@@ -62,7 +86,8 @@ class InMemoryRateLimiter:
             }
         
         # Add current request
-        self.requests[key].append(now)
+        buckets[-1] += 1
+        entry[1] = current_requests + 1
         
         return True, {
             "allowed": limit,
@@ -70,62 +95,91 @@ class InMemoryRateLimiter:
             "reset_time": int(now + window),
             "current": current_requests + 1
         }
+    
+    def _collect_expired(self, now: float):
+        """Drop keys whose window has fully elapsed and blocks that have expired"""
+        self._last_gc = now
+        now_sec = int(now)
+        
+        expired = [
+            key for key, (_, _, last_sec, window) in self.requests.items()
+            if now_sec - last_sec >= window
+        ]
+        for key in expired:
+            del self.requests[key]
+        
+        expired = [key for key, blocked_until in self.blocked_ips.items() if blocked_until <= now]
+        for key in expired:
+            del self.blocked_ips[key]
+
+
+# Checks the block key and the fixed-window counter in one atomic round trip.
+# KEYS: blocked key, window key. ARGV: now, window, limit.
+# Returns {status, value}: 1 = allowed (value = new count), 0 = blocked
+# (value = blocked until), -1 = over the limit (value = current count).
+RATE_LIMIT_SCRIPT = """
+local now = tonumber(ARGV[1])
+local blocked_until = tonumber(redis.call('GET', KEYS[1]) or '0')
+if blocked_until > now then
+    return {0, blocked_until}
+end
+local limit = tonumber(ARGV[3])
+local current = tonumber(redis.call('GET', KEYS[2]) or '0')
+if current >= limit then
+    if current >= limit * 2 then
+        redis.call('SETEX', KEYS[1], 3600, now + 3600)
+    end
+    return {-1, current}
+end
+current = redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+return {1, current}
+"""
 
 
 class RedisRateLimiter:
     """Redis-based rate limiter for production"""
     
     def __init__(self, redis_url: str):
-        if not REDIS_AVAILABLE or redis is None:
+        if not REDIS_AVAILABLE or aioredis is None:
             raise RuntimeError("Redis is not available but RedisRateLimiter was instantiated")
-        self.redis = redis.from_url(redis_url, decode_responses=True)
+        self.redis = aioredis.from_url(redis_url, decode_responses=True, max_connections=64)
+        # Script objects run via EVALSHA and reload the script on NOSCRIPT
+        self.script = self.redis.register_script(RATE_LIMIT_SCRIPT)
     
     async def is_allowed(self, key: str, limit: int, window: int) -> Tuple[bool, Dict[str, int]]:
         """Check if request is allowed within rate limit"""
         now = int(time.time())
-        pipeline = self.redis.pipeline()
         
-        # Check if IP is blocked
+        # Use sliding window counter
         blocked_key = f"blocked:{key}"
-        blocked_until = self.redis.get(blocked_key)
-        if blocked_until and int(blocked_until) > now:
-            remaining_block_time = int(blocked_until) - now
+        window_key = f"rate_limit:{key}:{now // window}"
+        reset_time = (now // window + 1) * window
+        
+        status_code, value = await self.script(keys=[blocked_key, window_key], args=[now, window, limit])
+        value = int(value)
+        
+        if status_code == 0:
             return False, {
                 "allowed": limit,
                 "remaining": 0,
-                "reset_time": int(blocked_until),
-                "blocked_for": remaining_block_time
+                "reset_time": value,
+                "blocked_for": value - now
             }
         
-        # Use sliding window counter
-        window_key = f"rate_limit:{key}:{now // window}"
-        
-        # Get current count
-        current_count = self.redis.get(window_key)
-        current_count = int(current_count) if current_count else 0
-        
-        if current_count >= limit:
-            # Block IP for extended period on repeated violations
-            if current_count >= limit * 2:
-                self.redis.setex(blocked_key, 3600, now + 3600)  # Block for 1 hour
-            
+        if status_code < 0:
             return False, {
                 "allowed": limit,
                 "remaining": 0,
-                "reset_time": (now // window + 1) * window,
-                "current": current_count
+                "reset_time": reset_time,
+                "current": value
             }
         
-        # Increment counter
-        pipeline.incr(window_key)
-        pipeline.expire(window_key, window)
-        pipeline.execute()
-        
         return True, {
             "allowed": limit,
-            "remaining": limit - current_count - 1,
-            "reset_time": (now // window + 1) * window,
-            "current": current_count + 1
+            "remaining": limit - value,
+            "reset_time": reset_time,
+            "current": value
         }
 
 
@@ -155,39 +209,47 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             # Default limit for all other endpoints
             "default": {"limit": 100, "window": 300}  # 100 requests per 5 minutes
         }
+        
+        # Longest prefix first so the most specific rule wins
+        self._prefix_table = tuple(sorted(
+            ((prefix, config) for prefix, config in self.rate_limits.items() if prefix != "default"),
+            key=lambda item: -len(item[0])
+        ))
+        self._default_config = self.rate_limits["default"]
+        self._lookup_config = lru_cache(maxsize=2048)(self._match_rate_limit_config)
+        
+        # Health checks and docs are never rate limited
+        self.skip_paths = frozenset({"/api/health", "/", "/docs", "/redoc", "/openapi.json"})
     
     def get_client_ip(self, request: Request) -> str:
         """Extract client IP address"""
-        # Check for forwarded IP headers (for reverse proxy setups)
-        forwarded_for = request.headers.get("X-Forwarded-For")
-        if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
-        
-        real_ip = request.headers.get("X-Real-IP")
-        if real_ip:
-            return real_ip
-        
-        # Fallback to direct connection
-        return request.client.host if request.client else "unknown"
+        return extract_client_ip(request.headers, request.client)
     
     def get_rate_limit_config(self, path: str) -> Dict[str, int]:
         """Get rate limit configuration for a specific path"""
-        # Check for exact matches first
-        for endpoint, config in self.rate_limits.items():
-            if endpoint != "default" and path.startswith(endpoint):
+        return self._lookup_config(path)
+    
+    def _match_rate_limit_config(self, path: str) -> Dict[str, int]:
+        """Scan the prefix table for the first matching rule"""
+        for prefix, config in self._prefix_table:
+            if path.startswith(prefix):
                 return config
         
         # Return default configuration
-        return self.rate_limits["default"]
+        return self._default_config
+    
+    async def __call__(self, scope, receive, send):
+        # Excluded paths bypass BaseHTTPMiddleware's request/stream wrapping entirely
+        if scope["type"] == "http" and scope["path"] in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
     
     async def dispatch(self, request: Request, call_next):
         """Process request with rate limiting"""
         path = request.url.path
-        client_ip = self.get_client_ip(request)
         
-        # Skip rate limiting for health checks and static files
-        if path in ["/api/health", "/", "/docs", "/redoc", "/openapi.json"]:
-            return await call_next(request)
+        client_ip = self.get_client_ip(request)
         
         # Get rate limit configuration
         config = self.get_rate_limit_config(path)
@@ -199,10 +261,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         
         # Check rate limit
         try:
-            if isinstance(self.limiter, RedisRateLimiter):
-                allowed, info = await self.limiter.is_allowed(rate_limit_key, limit, window)
-            else:
-                allowed, info = self.limiter.is_allowed(rate_limit_key, limit, window)
+            allowed, info = await self.limiter.is_allowed(rate_limit_key, limit, window)
             
             if not allowed:
                 # Log rate limit violation
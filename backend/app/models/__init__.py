@@ -1,8 +1,31 @@
 """Models package initialization"""
 
-from app.models.user import User, ZonePermission, PowerDNSServer, UserRole, APIToken, ZoneVersion
-from app.models.dns import Zone, Record
-from app.models.settings import SystemSettings, PowerDNSSettings
-from app.models.audit import AuditLog, AuditEventType
+import importlib
+
+# Model modules are imported on first attribute access (PEP 562) so importing
+# one model does not pull every other module's metadata in with it
+_LAZY = {
+    "User": "app.models.user",
+    "ZonePermission": "app.models.user",
+    "PowerDNSServer": "app.models.user",
+    "UserRole": "app.models.user",
+    "APIToken": "app.models.user",
+    "ZoneVersion": "app.models.user",
+    "Zone": "app.models.dns",
+    "Record": "app.models.dns",
+    "SystemSettings": "app.models.settings",
+    "PowerDNSSettings": "app.models.settings",
+    "AuditLog": "app.models.audit",
+    "AuditEventType": "app.models.audit",
+}
 
 __all__ = ["User", "ZonePermission", "PowerDNSServer", "UserRole", "APIToken", "ZoneVersion", "Zone", "Record", "SystemSettings", "PowerDNSSettings", "AuditLog", "AuditEventType"]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -1,19 +1,23 @@
 """Audit logging models and service"""
 
-from datetime import datetime
-from typing import Optional, Dict, Any, TYPE_CHECKING
-from sqlalchemy import String, DateTime, JSON, Text, Integer, ForeignKey, Enum as SQLEnum
+import asyncio
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional, Dict, Any, List, TYPE_CHECKING
+from sqlalchemy import Row, String, DateTime, Text, Integer, SmallInteger, ForeignKey, Index, insert, select, text
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.sql import func
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 import enum
-import json
 
-from app.core.database import Base
+from app.core.config import settings
+from app.core.database import Base, JSONDocument, audit_session_maker, engine, json_dumps
 
 if TYPE_CHECKING:
     from app.models.user import User
 
+logger = logging.getLogger(__name__)
+
 
 class AuditEventType(enum.Enum):
     """Types of audit events"""
@@ -61,41 +65,430 @@ class AuditEventType(enum.Enum):
     VERSION_ROLLBACK = "version_rollback"
 
 
+# Per-event description templates, built once instead of per call
+_AUTH_DESC = {et: f"Authentication event: {et.value} for {{email}}" for et in AuditEventType}
+_ZONE_DESC = {et: f"Zone {et.value}: {{zone}} by {{email}}" for et in AuditEventType}
+_RECORD_DESC = {et: f"Record {et.value}: {{name}} ({{type}}) in {{zone}} by {{email}}" for et in AuditEventType}
+
+# Stable on-disk codes for event types; never renumber, only append
+AUDIT_EVENT_CODES: Dict[AuditEventType, int] = {
+    AuditEventType.LOGIN_SUCCESS: 1,
+    AuditEventType.LOGIN_FAILED: 2,
+    AuditEventType.LOGOUT: 3,
+    AuditEventType.PASSWORD_CHANGE: 4,
+    AuditEventType.PASSWORD_RESET_REQUEST: 5,
+    AuditEventType.PASSWORD_RESET_SUCCESS: 6,
+    AuditEventType.USER_CREATED: 7,
+    AuditEventType.USER_UPDATED: 8,
+    AuditEventType.USER_DELETED: 9,
+    AuditEventType.USER_ROLE_CHANGED: 10,
+    AuditEventType.USER_PERMISSION_GRANTED: 11,
+    AuditEventType.USER_PERMISSION_REVOKED: 12,
+    AuditEventType.ZONE_CREATED: 13,
+    AuditEventType.ZONE_UPDATED: 14,
+    AuditEventType.ZONE_DELETED: 15,
+    AuditEventType.RECORD_CREATED: 16,
+    AuditEventType.RECORD_UPDATED: 17,
+    AuditEventType.RECORD_DELETED: 18,
+    AuditEventType.API_TOKEN_CREATED: 19,
+    AuditEventType.API_TOKEN_USED: 20,
+    AuditEventType.API_TOKEN_DELETED: 21,
+    AuditEventType.API_TOKEN_DEACTIVATED: 22,
+    AuditEventType.UNAUTHORIZED_ACCESS: 23,
+    AuditEventType.RATE_LIMIT_EXCEEDED: 24,
+    AuditEventType.SUSPICIOUS_ACTIVITY: 25,
+    AuditEventType.BACKUP_CREATED: 26,
+    AuditEventType.BACKUP_RESTORED: 27,
+    AuditEventType.VERSION_CREATED: 28,
+    AuditEventType.VERSION_ROLLBACK: 29,
+}
+AUDIT_EVENT_BY_CODE: Dict[int, AuditEventType] = {code: event for event, code in AUDIT_EVENT_CODES.items()}
+
+
+class AuditEventTypeCode(TypeDecorator):
+    """Stores AuditEventType members as SMALLINT codes"""
+    impl = SmallInteger
+    cache_ok = True
+    
+    def process_bind_param(self, value: Optional[AuditEventType], dialect) -> Optional[int]:
+        return AUDIT_EVENT_CODES[value] if value is not None else None
+    
+    def process_result_value(self, value: Optional[int], dialect) -> Optional[AuditEventType]:
+        return AUDIT_EVENT_BY_CODE[value] if value is not None else None
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class AuditLog(Base):
     """Audit log entry"""
     __tablename__ = "audit_logs"
+    # On PostgreSQL the table is range-partitioned by month on created_at by
+    # migration f1c9a27d5b84; see ensure_audit_partitions() for upkeep
+    __table_args__ = (
+        # Match the common "filter by X, newest first" audit queries
+        Index("ix_audit_resource_created", "resource_type", "resource_id", "created_at"),
+        Index("ix_audit_user_created", "user_id", "created_at"),
+        Index("ix_audit_eventtype_created", "event_type", "created_at"),
+    )
+    # Fetch the generated id via INSERT ... RETURNING instead of a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     
     # Event information
-    event_type: Mapped[AuditEventType] = mapped_column(SQLEnum(AuditEventType), nullable=False, index=True)
+    event_type: Mapped[AuditEventType] = mapped_column(AuditEventTypeCode, nullable=False)
     event_description: Mapped[str] = mapped_column(Text, nullable=False)
     
     # User information
-    user_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("users.id"), nullable=True, index=True)
+    user_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("users.id"), nullable=True)
     user_email: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)  # Store email for deleted users
     user_ip: Mapped[Optional[str]] = mapped_column(String(45), nullable=True)  # IPv4/IPv6
-    user_agent: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Bulky text columns are loaded on demand; list queries select the columns they show
+    user_agent: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True, deferred_group="audit_details")
     
     # Resource information
-    resource_type: Mapped[Optional[str]] = mapped_column(String(50), nullable=True, index=True)  # zone, record, user, etc.
+    resource_type: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)  # zone, record, user, etc.
     resource_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)
     resource_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     
     # Additional context
-    details: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
+    details: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONDocument, nullable=True)
     
     # Timestamp
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=func.now(), nullable=False, index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, nullable=False, index=True)
     
     # Success/failure status
     success: Mapped[bool] = mapped_column(default=True, nullable=False, index=True)
-    error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True, deferred_group="audit_details")
     
     # Relationships
     user: Mapped[Optional["User"]] = relationship("User", back_populates="audit_logs")
 
 
+class AuditLogBuffer:
+    """Queues audit rows and writes them in batches from a background task"""
+    
+    # Column order for COPY-based bulk writes
+    COPY_COLUMNS = (
+        "event_type", "event_description", "user_id", "user_email", "user_ip", "user_agent",
+        "resource_type", "resource_id", "resource_name", "details", "created_at", "success", "error_message"
+    )
+    
+    def __init__(
+        self,
+        max_batch: int = 500,
+        max_delay: float = 0.05,
+        max_queue: int = 10000,
+        copy_threshold: int = 100,
+        session_factory: async_sessionmaker = audit_session_maker
+    ):
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.max_queue = max_queue
+        self.copy_threshold = copy_threshold
+        self.session_factory = session_factory
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # Rows taken off the queue but not yet handed to a flush, and the write in progress
+        self._pending: List[Dict[str, Any]] = []
+        self._flushing: Optional[asyncio.Future] = None
+    
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+    
+    def start(self):
+        """Start the background flush task on the running loop"""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._task = asyncio.get_running_loop().create_task(self._run())
+    
+    async def stop(self):
+        """Stop the flush task and write out anything still queued"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        
+        # Let a write already in progress finish, then pick up whatever was left behind
+        if self._flushing is not None:
+            await self._flushing
+            self._flushing = None
+        batch, self._pending = self._pending, []
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        if batch:
+            await self._flush(batch)
+    
+    def put(self, row: Dict[str, Any]) -> bool:
+        """Queue a row for writing; False if the buffer cannot take it"""
+        if not self.running:
+            return False
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            return False
+        return True
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            self._pending = [await self._queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(self._pending) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    self._pending.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            batch, self._pending = self._pending, []
+            # Shielded so cancelling the task in stop() does not cut a write off halfway
+            self._flushing = asyncio.ensure_future(self._flush(batch))
+            await asyncio.shield(self._flushing)
+            self._flushing = None
+    
+    async def _flush(self, batch: List[Dict[str, Any]]):
+        """Insert a batch of audit rows, falling back to one transaction per row
+        
+        The callers have already returned, so nothing upstream can retry: a
+        failed batch is written row by row so one bad row (or a transient
+        error) does not take the rest with it, and any row that still cannot
+        be written is logged in full rather than dropped silently.
+        """
+        try:
+            async with self.session_factory() as session:
+                if len(batch) >= self.copy_threshold and session.bind.dialect.name == "postgresql":
+                    await self._copy_batch(session, batch)
+                else:
+                    await session.execute(insert(AuditLog), batch)
+                await session.commit()
+            return
+        except Exception as e:
+            logger.warning(f"Failed to write {len(batch)} audit log entries as a batch, retrying row by row: {e}")
+        
+        for row in batch:
+            try:
+                async with self.session_factory() as session:
+                    await session.execute(insert(AuditLog), [row])
+                    await session.commit()
+            except Exception as e:
+                logger.error(f"Dropped audit log entry {row!r}: {e}")
+    
+    async def _copy_batch(self, session: AsyncSession, batch: List[Dict[str, Any]]):
+        """Bulk load a batch through PostgreSQL COPY on the session's connection"""
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        
+        records = [
+            (
+                AUDIT_EVENT_CODES[row["event_type"]],
+                row["event_description"],
+                row["user_id"],
+                row["user_email"],
+                row["user_ip"],
+                row["user_agent"],
+                row["resource_type"],
+                row["resource_id"],
+                row["resource_name"],
+                json_dumps(row["details"]) if row["details"] is not None else None,
+                row["created_at"],
+                row["success"],
+                row["error_message"]
+            )
+            for row in batch
+        ]
+        
+        await raw_connection.driver_connection.copy_records_to_table(
+            AuditLog.__tablename__,
+            records=records,
+            columns=self.COPY_COLUMNS
+        )
+
+
+# Columns shown in a user's security event listing
+_USER_EVENT_COLUMNS = (
+    AuditLog.id,
+    AuditLog.event_type,
+    AuditLog.event_description,
+    AuditLog.user_ip,
+    AuditLog.user_agent,
+    AuditLog.created_at,
+    AuditLog.success,
+)
+
+
+# Global audit log buffer, started with the application
+audit_log_buffer = AuditLogBuffer()
+
+
+_PARTITION_PREFIX = "audit_logs_"
+_DEFAULT_PARTITION = "audit_logs_default"
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+async def _audit_partitions_enabled(conn) -> bool:
+    """Whether audit_logs is a partitioned PostgreSQL table"""
+    if conn.dialect.name != "postgresql":
+        return False
+    result = await conn.scalar(
+        text("SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass('audit_logs')")
+    )
+    return result is not None
+
+
+async def _audit_partition_names(conn) -> List[str]:
+    """Names of the tables currently attached to audit_logs"""
+    result = await conn.execute(text(
+        "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = to_regclass('audit_logs')"
+    ))
+    return list(result.scalars())
+
+
+async def _create_audit_partition(conn, month: date):
+    """Create one monthly partition, taking over its rows from audit_logs_default
+    
+    PostgreSQL refuses to add a partition whose range already has rows in the
+    default partition, so the table is built detached, filled from the default
+    partition and only then attached.
+    """
+    # Workers run this concurrently; serialize them and re-check under the lock
+    await conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('audit_logs_partitions'))"))
+    name = f"{_PARTITION_PREFIX}{month:%Y_%m}"
+    if name in await _audit_partition_names(conn):
+        return
+    
+    start, end = month.isoformat(), _next_month(month).isoformat()
+    await conn.execute(text(f"CREATE TABLE {name} (LIKE audit_logs INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+    if await conn.scalar(text(f"SELECT to_regclass('{_DEFAULT_PARTITION}')")) is not None:
+        await conn.execute(text(
+            f"WITH moved AS (DELETE FROM {_DEFAULT_PARTITION} "
+            f"WHERE created_at >= '{start}' AND created_at < '{end}' RETURNING *) "
+            f"INSERT INTO {name} SELECT * FROM moved"
+        ))
+    await conn.execute(text(f"ALTER TABLE audit_logs ATTACH PARTITION {name} FOR VALUES FROM ('{start}') TO ('{end}')"))
+
+
+async def ensure_audit_partitions(months_ahead: int = 2):
+    """Create the monthly audit_logs partitions from this month through months_ahead
+    
+    Months that already have rows sitting in audit_logs_default (written while
+    their partition was missing) get a partition too, and the rows move into it.
+    """
+    today = datetime.now(timezone.utc).date()
+    month = date(today.year, today.month, 1)
+    wanted = set()
+    for _ in range(months_ahead + 1):
+        wanted.add(month)
+        month = _next_month(month)
+    
+    try:
+        async with engine.begin() as conn:
+            if not await _audit_partitions_enabled(conn):
+                return
+            existing = set(await _audit_partition_names(conn))
+            if _DEFAULT_PARTITION in existing:
+                result = await conn.execute(text(
+                    f"SELECT DISTINCT date_trunc('month', created_at)::date FROM {_DEFAULT_PARTITION}"
+                ))
+                wanted.update(result.scalars())
+    except Exception as e:
+        logger.error(f"Failed to check audit log partitions: {e}")
+        return
+    
+    # One transaction per month so a failure does not hold back the others
+    for month in sorted(wanted):
+        if f"{_PARTITION_PREFIX}{month:%Y_%m}" in existing:
+            continue
+        try:
+            async with engine.begin() as conn:
+                await _create_audit_partition(conn, month)
+        except Exception as e:
+            logger.error(f"Failed to create audit log partition for {month:%Y-%m}: {e}")
+
+
+async def drop_audit_partitions_before(cutoff: date) -> List[str]:
+    """Drop monthly audit_logs partitions that end on or before cutoff
+    
+    Retention on a partitioned table is a metadata-only DROP TABLE per month
+    instead of a DELETE over every expired row. Returns the dropped tables.
+    """
+    dropped = []
+    async with engine.begin() as conn:
+        if not await _audit_partitions_enabled(conn):
+            return dropped
+        for name in await _audit_partition_names(conn):
+            try:
+                month = datetime.strptime(name[len(_PARTITION_PREFIX):], "%Y_%m").date()
+            except ValueError:
+                continue  # audit_logs_default and anything not created here
+            if _next_month(month) <= cutoff:
+                await conn.execute(text(f'DROP TABLE "{name}"'))
+                dropped.append(name)
+    if dropped:
+        logger.info(f"Dropped expired audit log partitions: {', '.join(sorted(dropped))}")
+    return dropped
+
+
+class AuditPartitionMaintenance:
+    """Keeps the audit_logs partitions ahead of the clock and applies retention"""
+    
+    def __init__(self, interval: float = 6 * 3600, months_ahead: int = 2, retention_days: int = 0):
+        self.interval = interval
+        self.months_ahead = months_ahead
+        self.retention_days = retention_days
+        self._task: Optional[asyncio.Task] = None
+    
+    async def run_once(self):
+        """Create upcoming partitions, then drop the ones past retention"""
+        await ensure_audit_partitions(self.months_ahead)
+        if self.retention_days <= 0:
+            return
+        cutoff = datetime.now(timezone.utc).date() - timedelta(days=self.retention_days)
+        try:
+            await drop_audit_partitions_before(cutoff)
+        except Exception as e:
+            logger.error(f"Failed to drop expired audit log partitions: {e}")
+    
+    def start(self):
+        """Repeat the upkeep every interval on the running loop"""
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+    
+    async def stop(self):
+        """Cancel the periodic upkeep"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+    
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.run_once()
+
+
+# Global partition upkeep, run at startup and then periodically by the application
+audit_partition_maintenance = AuditPartitionMaintenance(retention_days=settings.audit_log_retention_days)
+
+
 class AuditService:
     """Service for audit logging"""
     
@@ -114,38 +507,86 @@ class AuditService:
         resource_type: Optional[str] = None,
         resource_id: Optional[str] = None,
         resource_name: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None,
+        details: Optional[Dict[str, Any]] = None,
         success: bool = True,
         error_message: Optional[str] = None
-    ) -> AuditLog:
-        """Log an audit event"""
+    ) -> None:
+        """Log an audit event
+        
+        The entry is handed to the background audit buffer. When the buffer is
+        not running or is full it is inserted on this session instead, and the
+        caller's unit of work is responsible for the commit.
+        """
         
         # Extract user information if user object provided
         if user:
             user_id = user.id
             user_email = user.email
         
-        audit_entry = AuditLog(
-            event_type=event_type,
-            event_description=description,
-            user_id=user_id,
-            user_email=user_email,
-            user_ip=user_ip,
-            user_agent=user_agent,
-            resource_type=resource_type,
-            resource_id=resource_id,
-            resource_name=resource_name,
-            metadata=metadata,
-            success=success,
-            error_message=error_message
-        )
+        row = {
+            "event_type": event_type,
+            "event_description": description,
+            "user_id": user_id,
+            "user_email": user_email,
+            "user_ip": user_ip,
+            "user_agent": user_agent,
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "resource_name": resource_name,
+            "details": details,
+            "success": success,
+            "error_message": error_message,
+            # Stamped now: the buffer may hold the row well past the event under load
+            "created_at": _utcnow()
+        }
+        
+        if audit_log_buffer.put(row):
+            return
+        
+        # Append-only rows: a Core INSERT skips the ORM unit of work entirely
+        await self.session.execute(insert(AuditLog).values(row))
+    
+    async def log_event_sync(self, event_type: AuditEventType, description: str, **kwargs) -> AuditLog:
+        """Log an audit event on this session; the caller commits it"""
+        user = kwargs.pop("user", None)
+        if user:
+            kwargs["user_id"] = user.id
+            kwargs["user_email"] = user.email
+        
+        return await self._write_entry({
+            "event_type": event_type,
+            "event_description": description,
+            **kwargs
+        })
+    
+    async def _write_entry(self, row: Dict[str, Any]) -> AuditLog:
+        """Add a single audit entry to this service's session and flush it
+        
+        The INSERT joins the caller's transaction so the entry commits (or
+        rolls back) together with the operation it records.
+        """
+        audit_entry = AuditLog(**row)
         
         self.session.add(audit_entry)
-        await self.session.commit()
-        await self.session.refresh(audit_entry)
+        await self.session.flush()
         
         return audit_entry
     
+    async def get_user_events(self, user_id: int, limit: int = 50, offset: int = 0) -> List[Row]:
+        """Get a page of audit events for a user, newest first
+        
+        Rows are plain named tuples rather than mapped instances, so listing
+        builds no identity map entries or per-object state.
+        """
+        result = await self.session.execute(
+            select(*_USER_EVENT_COLUMNS)
+            .where(AuditLog.user_id == user_id)
+            .order_by(AuditLog.created_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        return list(result)
+    
     async def log_authentication_event(
         self,
         event_type: AuditEventType,
@@ -154,13 +595,13 @@ class AuditService:
         user_agent: Optional[str] = None,
         success: bool = True,
         error_message: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None
-    ) -> AuditLog:
+        details: Optional[Dict[str, Any]] = None
+    ) -> None:
         """Log authentication-related events"""
         
-        description = f"Authentication event: {event_type.value} for {user_email}"
+        description = _AUTH_DESC[event_type].format(email=user_email)
         
-        return await self.log_event(
+        await self.log_event(
             event_type=event_type,
             description=description,
             user_email=user_email,
@@ -169,7 +610,7 @@ class AuditService:
             resource_type="authentication",
             success=success,
             error_message=error_message,
-            metadata=metadata
+            details=details
         )
     
     async def log_zone_event(
@@ -179,13 +620,13 @@ class AuditService:
         user: "User",
         user_ip: Optional[str] = None,
         user_agent: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None
-    ) -> AuditLog:
+        details: Optional[Dict[str, Any]] = None
+    ) -> None:
         """Log zone-related events"""
         
-        description = f"Zone {event_type.value}: {zone_name} by {user.email}"
+        description = _ZONE_DESC[event_type].format(zone=zone_name, email=user.email)
         
-        return await self.log_event(
+        await self.log_event(
             event_type=event_type,
             description=description,
             user=user,
@@ -194,7 +635,7 @@ class AuditService:
             resource_type="zone",
             resource_id=zone_name,
             resource_name=zone_name,
-            metadata=metadata
+            details=details
         )
     
     async def log_record_event(
@@ -206,13 +647,15 @@ class AuditService:
         user: "User",
         user_ip: Optional[str] = None,
         user_agent: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None
-    ) -> AuditLog:
+        details: Optional[Dict[str, Any]] = None
+    ) -> None:
         """Log DNS record-related events"""
         
-        description = f"Record {event_type.value}: {record_name} ({record_type}) in {zone_name} by {user.email}"
+        description = _RECORD_DESC[event_type].format(
+            name=record_name, type=record_type, zone=zone_name, email=user.email
+        )
         
-        return await self.log_event(
+        await self.log_event(
             event_type=event_type,
             description=description,
             user=user,
@@ -221,7 +664,7 @@ class AuditService:
             resource_type="record",
             resource_id=f"{zone_name}:{record_name}:{record_type}",
             resource_name=f"{record_name}.{zone_name}",
-            metadata=metadata
+            details=details
         )
     
     async def log_security_event(
@@ -231,11 +674,11 @@ class AuditService:
         user_ip: Optional[str] = None,
         user_agent: Optional[str] = None,
         user_email: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None
-    ) -> AuditLog:
+        details: Optional[Dict[str, Any]] = None
+    ) -> None:
         """Log security-related events"""
         
-        return await self.log_event(
+        await self.log_event(
             event_type=event_type,
             description=description,
             user_email=user_email,
@@ -243,5 +686,5 @@ class AuditService:
             user_agent=user_agent,
             resource_type="security",
             success=False,  # Security events are typically failures
-            metadata=metadata
+            details=details
         )
@@ -1,7 +1,6 @@
 """Settings models for DNSMate"""
 
 from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime
-from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
 from app.core.database import Base
 
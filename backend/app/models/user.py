@@ -1,12 +1,13 @@
 """User models and authentication setup"""
 
+import hashlib
 import secrets
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 from fastapi_users_db_sqlalchemy import SQLAlchemyBaseUserTable
-from sqlalchemy import String, Boolean, Integer, ForeignKey, Text, Enum as SQLEnum, DateTime, JSON, func
+from sqlalchemy import String, Boolean, Integer, ForeignKey, Text, Enum as SQLEnum, DateTime, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.core.database import Base
+from app.core.database import Base, CompressedJSON
 import enum
 
 
@@ -96,10 +97,15 @@ class APIToken(Base):
         """Generate a new API token"""
         return f"dnsmate_{secrets.token_urlsafe(32)}"
     
+    @staticmethod
+    def hash_token(token: str) -> str:
+        """Hash a token value for storage and lookup"""
+        # Tokens are URL-safe base64, so ASCII encoding is exact
+        return hashlib.sha256(token.encode("ascii")).hexdigest()
+    
     def set_token(self, token: str):
         """Set token hash and preview"""
-        import hashlib
-        self.token_hash = hashlib.sha256(token.encode()).hexdigest()
+        self.token_hash = self.hash_token(token)
         self.token_preview = token[:8] + "..."
 
 
@@ -112,9 +118,9 @@ class ZoneVersion(Base):
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
     version_number: Mapped[int] = mapped_column(Integer, nullable=False)
     
-    # Version data
-    zone_data: Mapped[dict] = mapped_column(JSON, nullable=False)  # Full zone configuration
-    records_data: Mapped[dict] = mapped_column(JSON, nullable=False)  # All records at this version
+    # Version data, stored compressed: full snapshots are large and only read on rollback/compare
+    zone_data: Mapped[dict] = mapped_column(CompressedJSON, nullable=False)  # Full zone configuration
+    records_data: Mapped[dict] = mapped_column(CompressedJSON, nullable=False)  # All records at this version
     
     # Metadata
     description: Mapped[Optional[str]] = mapped_column(String, nullable=True)
@@ -123,3 +129,7 @@ class ZoneVersion(Base):
     
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="zone_versions")
+
+
+# User.audit_logs refers to AuditLog by name, so its mapper must be registered too
+from app.models import audit  # noqa: E402,F401
@@ -1,11 +1,27 @@
 """DNS schemas for API requests and responses"""
 
-from pydantic import BaseModel, Field, validator
+import socket
+from functools import lru_cache
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 from typing import Optional, List
 from datetime import datetime
 
 from app.schemas.user import UserRead
 
+_RECORD_TYPES = ('A', 'AAAA', 'CNAME', 'MX', 'NS', 'PTR', 'SOA', 'SRV', 'TXT', 'CAA')
+_VALID_RECORD_TYPES = frozenset(_RECORD_TYPES)
+_RECORD_TYPE_ERROR = f'Record type must be one of: {", ".join(_RECORD_TYPES)}'
+_ZONE_KINDS = frozenset({'Native', 'Master', 'Slave'})
+_PRIORITY_TYPES = frozenset({'MX', 'SRV'})
+
+
+@lru_cache(maxsize=4096)
+def _normalize_zone(name: str) -> str:
+    """Fully qualify and lowercase a zone name"""
+    if not name.endswith('.'):
+        name = name + '.'
+    return name.lower()
+
 
 class ZoneCreate(BaseModel):
     """Zone creation schema"""
@@ -14,15 +30,18 @@ class ZoneCreate(BaseModel):
     masters: Optional[List[str]] = Field(None, description="Master servers for slave zones")
     account: Optional[str] = Field(None, description="Account identifier")
     
-    @validator('name')
+    @field_validator('name')
+    @classmethod
     def validate_zone_name(cls, v):
-        if not v.endswith('.'):
-            v = v + '.'
-        return v.lower()
+        # Already-normalized names (the common case) are returned as is
+        if v.endswith('.') and v.islower():
+            return v
+        return _normalize_zone(v)
     
-    @validator('kind')
+    @field_validator('kind')
+    @classmethod
     def validate_kind(cls, v):
-        if v not in ['Native', 'Master', 'Slave']:
+        if v not in _ZONE_KINDS:
             raise ValueError('Kind must be Native, Master, or Slave')
         return v
 
@@ -39,8 +58,7 @@ class ZoneRead(BaseModel):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RecordCreate(BaseModel):
@@ -52,44 +70,41 @@ class RecordCreate(BaseModel):
     priority: Optional[int] = Field(None, description="Priority for MX/SRV records")
     disabled: bool = Field(False, description="Whether the record is disabled")
     
-    @validator('type')
+    @field_validator('type')
+    @classmethod
     def validate_record_type(cls, v):
-        valid_types = ['A', 'AAAA', 'CNAME', 'MX', 'NS', 'PTR', 'SOA', 'SRV', 'TXT', 'CAA']
-        if v.upper() not in valid_types:
-            raise ValueError(f'Record type must be one of: {", ".join(valid_types)}')
-        return v.upper()
+        v = v.upper()
+        if v not in _VALID_RECORD_TYPES:
+            raise ValueError(_RECORD_TYPE_ERROR)
+        return v
     
-    @validator('ttl')
+    @field_validator('ttl')
+    @classmethod
     def validate_ttl(cls, v):
         if v is not None and (v < 1 or v > 86400):
             raise ValueError('TTL must be between 1 and 86400 seconds')
         return v
     
-    @validator('content')
-    def validate_content(cls, v, values):
+    @field_validator('content')
+    @classmethod
+    def validate_content(cls, v, info: ValidationInfo):
         """Validate content based on record type"""
-        if 'type' not in values:
+        record_type = info.data.get('type')
+        if record_type is None:
             return v
             
-        record_type = values['type'].upper()
         content = v.strip()
         
         if record_type == 'A':
-            # Basic IPv4 validation
-            parts = content.split('.')
-            if len(parts) != 4:
-                raise ValueError('A record must be a valid IPv4 address')
             try:
-                for part in parts:
-                    num = int(part)
-                    if not 0 <= num <= 255:
-                        raise ValueError('A record must be a valid IPv4 address')
-            except ValueError:
+                socket.inet_pton(socket.AF_INET, content)
+            except OSError:
                 raise ValueError('A record must be a valid IPv4 address')
         
         elif record_type == 'AAAA':
-            # Basic IPv6 validation (simplified)
-            if ':' not in content:
+            try:
+                socket.inet_pton(socket.AF_INET6, content)
+            except OSError:
                 raise ValueError('AAAA record must be a valid IPv6 address')
         
         elif record_type == 'MX':
@@ -113,15 +128,15 @@ class RecordCreate(BaseModel):
                 
         return content
     
-    @validator('priority')
-    def validate_priority(cls, v, values):
+    @field_validator('priority')
+    @classmethod
+    def validate_priority(cls, v, info: ValidationInfo):
         """Validate priority for record types that require it"""
-        if 'type' not in values:
+        record_type = info.data.get('type')
+        if record_type is None:
             return v
-            
-        record_type = values['type'].upper()
         
-        if record_type in ['MX', 'SRV'] and v is None:
+        if record_type in _PRIORITY_TYPES and v is None:
             raise ValueError(f'{record_type} records require a priority value')
         
         if v is not None and (v < 0 or v > 65535):
@@ -137,7 +152,8 @@ class RecordUpdate(BaseModel):
     priority: Optional[int] = None
     disabled: Optional[bool] = None
     
-    @validator('ttl')
+    @field_validator('ttl')
+    @classmethod
     def validate_ttl(cls, v):
         if v is not None and (v < 1 or v > 86400):
             raise ValueError('TTL must be between 1 and 86400 seconds')
@@ -157,8 +173,7 @@ class RecordRead(BaseModel):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ZoneVersionRead(BaseModel):
@@ -172,8 +187,7 @@ class ZoneVersionRead(BaseModel):
     changes_summary: Optional[str] = None
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ZoneBackupRead(BaseModel):
@@ -1,13 +1,22 @@
 """Settings schemas for DNSMate"""
 
-from pydantic import BaseModel, validator, Field
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing import Annotated
 from datetime import datetime
 
+
+# Shared constrained string types for the PowerDNS settings schemas.
+# The scheme check is a pattern constraint so pydantic-core enforces it
+# without a Python validator callback.
+ServerName = Annotated[str, Field(min_length=1, max_length=100)]
+ApiUrl = Annotated[str, Field(min_length=1, max_length=255, pattern=r'^https?://')]
+ApiKey = Annotated[str, Field(min_length=1, max_length=255)]
+
+
 class SystemSettingBase(BaseModel):
     key: str = Field(..., min_length=1, max_length=100)
-    value: Optional[str] = None
-    description: Optional[str] = Field(None, max_length=255)
+    value: str | None = None
+    description: str | None = Field(None, max_length=255)
     category: str = Field(default="general", max_length=50)
     is_encrypted: bool = False
 
@@ -15,23 +24,22 @@ class SystemSettingCreate(SystemSettingBase):
     pass
 
 class SystemSettingUpdate(BaseModel):
-    value: Optional[str] = None
-    description: Optional[str] = Field(None, max_length=255)
-    category: Optional[str] = Field(None, max_length=50)
+    value: str | None = None
+    description: str | None = Field(None, max_length=255)
+    category: str | None = Field(None, max_length=50)
 
 class SystemSetting(SystemSettingBase):
     id: int
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class PowerDNSSettingBase(BaseModel):
-    name: str = Field(..., min_length=1, max_length=100)
-    api_url: str = Field(..., min_length=1, max_length=255)
-    api_key: str = Field(..., min_length=1, max_length=255)
-    description: Optional[str] = None
+    name: ServerName
+    api_url: ApiUrl
+    api_key: ApiKey
+    description: str | None = None
     is_default: bool = False
     is_active: bool = True
     timeout: int = Field(default=30, ge=5, le=300)  # 5-300 seconds
@@ -39,43 +47,32 @@ class PowerDNSSettingBase(BaseModel):
     multi_server_mode: bool = Field(default=False, description="Enable multi-server operations")
 
 class PowerDNSSettingCreate(PowerDNSSettingBase):
-    @validator('api_url')
-    def validate_api_url(cls, v):
-        if not v.startswith(('http://', 'https://')):
-            raise ValueError('API URL must start with http:// or https://')
-        return v
+    pass
 
 class PowerDNSSettingUpdate(BaseModel):
-    name: Optional[str] = Field(None, min_length=1, max_length=100)
-    api_url: Optional[str] = Field(None, min_length=1, max_length=255)
-    api_key: Optional[str] = Field(None, min_length=1, max_length=255)
-    description: Optional[str] = None
-    is_default: Optional[bool] = None
-    is_active: Optional[bool] = None
-    timeout: Optional[int] = Field(None, ge=5, le=300)
-    verify_ssl: Optional[bool] = None
-    multi_server_mode: Optional[bool] = None
-
-    @validator('api_url')
-    def validate_api_url(cls, v):
-        if v is not None and not v.startswith(('http://', 'https://')):
-            raise ValueError('API URL must start with http:// or https://')
-        return v
+    name: ServerName | None = None
+    api_url: ApiUrl | None = None
+    api_key: ApiKey | None = None
+    description: str | None = None
+    is_default: bool | None = None
+    is_active: bool | None = None
+    timeout: int | None = Field(None, ge=5, le=300)
+    verify_ssl: bool | None = None
+    multi_server_mode: bool | None = None
 
 class PowerDNSSetting(PowerDNSSettingBase):
     id: int
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class PowerDNSSettingPublic(BaseModel):
     """Public view of PowerDNS settings without sensitive data"""
     id: int
     name: str
     api_url: str
-    description: Optional[str]
+    description: str | None
     is_default: bool
     is_active: bool
     timeout: int
@@ -84,33 +81,26 @@ class PowerDNSSettingPublic(BaseModel):
     created_at: datetime
     updated_at: datetime
     # Real-time health status
-    health_status: Optional[str] = None  # "healthy", "unhealthy", "unknown"
-    last_health_check: Optional[datetime] = None
-    health_response_time_ms: Optional[float] = None
+    health_status: str | None = None  # "healthy", "unhealthy", "unknown"
+    last_health_check: datetime | None = None
+    health_response_time_ms: float | None = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class PowerDNSTestConnection(BaseModel):
     """Schema for testing PowerDNS connection"""
-    api_url: str = Field(..., min_length=1, max_length=255)
-    api_key: str = Field(..., min_length=1, max_length=255)
+    api_url: ApiUrl
+    api_key: ApiKey
     timeout: int = Field(default=30, ge=5, le=300)
     verify_ssl: bool = True
 
-    @validator('api_url')
-    def validate_api_url(cls, v):
-        if not v.startswith(('http://', 'https://')):
-            raise ValueError('API URL must start with http:// or https://')
-        return v
-
 class PowerDNSTestResult(BaseModel):
     """Result of PowerDNS connection test"""
     success: bool
     message: str
-    response_time_ms: Optional[float] = None
-    server_version: Optional[str] = None
-    zones_count: Optional[int] = None
+    response_time_ms: float | None = None
+    server_version: str | None = None
+    zones_count: int | None = None
 
 
 class PowerDNSHealthStatus(BaseModel):
@@ -120,11 +110,13 @@ class PowerDNSHealthStatus(BaseModel):
     api_url: str
     is_active: bool
     health_status: str  # "healthy", "unhealthy", "unknown", "checking"
-    last_checked: Optional[datetime] = None
-    response_time_ms: Optional[float] = None
-    error_message: Optional[str] = None
-    server_version: Optional[str] = None
-    zones_count: Optional[int] = None
+    last_checked: datetime | None = None
+    response_time_ms: float | None = None
+    error_message: str | None = None
+    server_version: str | None = None
+    zones_count: int | None = None
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class PowerDNSHealthSummary(BaseModel):
@@ -134,7 +126,9 @@ class PowerDNSHealthSummary(BaseModel):
     unhealthy_servers: int
     unknown_servers: int
     last_check_time: datetime
-    servers: List[PowerDNSHealthStatus]
+    servers: list[PowerDNSHealthStatus]
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class VersioningSettingsBase(BaseModel):
@@ -150,11 +144,11 @@ class VersioningSettingsCreate(VersioningSettingsBase):
 
 
 class VersioningSettingsUpdate(BaseModel):
-    auto_version_enabled: Optional[bool] = None
-    auto_version_on_record_change: Optional[bool] = None
-    auto_version_on_zone_change: Optional[bool] = None
-    max_versions_per_zone: Optional[int] = Field(None, ge=10, le=500)
-    version_retention_days: Optional[int] = Field(None, ge=7, le=365)
+    auto_version_enabled: bool | None = None
+    auto_version_on_record_change: bool | None = None
+    auto_version_on_zone_change: bool | None = None
+    max_versions_per_zone: int | None = Field(None, ge=10, le=500)
+    version_retention_days: int | None = Field(None, ge=7, le=365)
 
 
 class VersioningSettings(VersioningSettingsBase):
@@ -162,5 +156,9 @@ class VersioningSettings(VersioningSettingsBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# Built once: validating a whole list through an adapter runs the loop in pydantic-core
+HEALTH_LIST_ADAPTER = TypeAdapter(list[PowerDNSHealthStatus])
+POWERDNS_PUBLIC_LIST_ADAPTER = TypeAdapter(list[PowerDNSSettingPublic])
@@ -1,6 +1,6 @@
 """API Token schemas"""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import Optional, List
 from datetime import datetime
 
@@ -24,8 +24,25 @@ class APITokenRead(BaseModel):
     expires_at: Optional[datetime] = None
     is_active: bool = True
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+    
+    @classmethod
+    def from_orm_trusted(cls, token) -> "APITokenRead":
+        """Build from an APIToken row without validation; only for values read back from the database"""
+        return cls.model_construct(
+            id=token.id,
+            name=token.name,
+            description=token.description,
+            token_preview=token.token_preview,
+            created_at=token.created_at,
+            last_used_at=token.last_used_at,
+            expires_at=token.expires_at,
+            is_active=token.is_active
+        )
+
+
+# Trusted models are dumped straight to JSON by the routes; response_model stays for OpenAPI only
+API_TOKEN_LIST_ADAPTER = TypeAdapter(list[APITokenRead])
 
 
 class APITokenResponse(BaseModel):
@@ -36,6 +53,8 @@ class APITokenResponse(BaseModel):
     description: Optional[str] = None
     created_at: datetime
     expires_at: Optional[datetime] = None
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class ZoneVersionCreate(BaseModel):
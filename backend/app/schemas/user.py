@@ -1,8 +1,7 @@
 """User schemas"""
 
 from fastapi_users import schemas
-from pydantic import BaseModel, EmailStr
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, EmailStr
 from app.models.user import UserRole
 
 
@@ -10,8 +9,8 @@ class UserRead(schemas.BaseUser[int]):
     """User read schema"""
     id: int
     email: EmailStr
-    first_name: Optional[str] = None
-    last_name: Optional[str] = None
+    first_name: str | None = None
+    last_name: str | None = None
     role: UserRole
     is_active: bool = True
     is_superuser: bool = False
@@ -22,24 +21,24 @@ class UserCreate(schemas.BaseUserCreate):
     """User create schema"""
     email: EmailStr
     password: str
-    first_name: Optional[str] = None
-    last_name: Optional[str] = None
+    first_name: str | None = None
+    last_name: str | None = None
     role: UserRole = UserRole.READER
-    is_active: Optional[bool] = True
-    is_superuser: Optional[bool] = False
-    is_verified: Optional[bool] = False
+    is_active: bool | None = True
+    is_superuser: bool | None = False
+    is_verified: bool | None = False
 
 
 class UserUpdate(schemas.BaseUserUpdate):
     """User update schema"""
-    password: Optional[str] = None
-    email: Optional[EmailStr] = None
-    first_name: Optional[str] = None
-    last_name: Optional[str] = None
-    role: Optional[UserRole] = None
-    is_active: Optional[bool] = None
-    is_superuser: Optional[bool] = None
-    is_verified: Optional[bool] = None
+    password: str | None = None
+    email: EmailStr | None = None
+    first_name: str | None = None
+    last_name: str | None = None
+    role: UserRole | None = None
+    is_active: bool | None = None
+    is_superuser: bool | None = None
+    is_verified: bool | None = None
 
 
 class ZonePermissionCreate(BaseModel):
@@ -58,26 +57,4 @@ class ZonePermissionRead(BaseModel):
     can_read: bool
     can_write: bool
     
-    class Config:
-        from_attributes = True
-
-
-class PowerDNSServerCreate(BaseModel):
-    """PowerDNS server create schema"""
-    name: str
-    api_url: str
-    api_key: str
-    description: Optional[str] = None
-    is_active: bool = True
-
-
-class PowerDNSServerRead(BaseModel):
-    """PowerDNS server read schema"""
-    id: int
-    name: str
-    api_url: str
-    description: Optional[str] = None
-    is_active: bool
-    
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
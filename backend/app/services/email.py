@@ -1,90 +1,49 @@
 """Email service for password reset and verification"""
 
-import smtplib
-import ssl
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import Optional
+import atexit
+import threading
+from functools import lru_cache
+from typing import Optional, TYPE_CHECKING
 import logging
-from datetime import datetime
+import time
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 
 from app.core.config import settings
 
+# smtplib, ssl and the email package are imported on first send, so
+# deployments with email disabled never load them
+if TYPE_CHECKING:
+    import smtplib
+    import ssl
+
 logger = logging.getLogger(__name__)
 
 
-class EmailService:
-    """Email service for sending notifications"""
-    
-    def __init__(self):
-        self.smtp_server = getattr(settings, 'smtp_server', 'smtp.gmail.com')
-        self.smtp_port = getattr(settings, 'smtp_port', 587)
-        self.smtp_username = getattr(settings, 'smtp_username', '')
-        self.smtp_password = getattr(settings, 'smtp_password', '')
-        self.from_email = getattr(settings, 'from_email', 'noreply@dnsmate.com')
-        self.from_name = getattr(settings, 'from_name', 'DNSMate')
-        self.enabled = getattr(settings, 'email_enabled', False)
-        
-        self.executor = ThreadPoolExecutor(max_workers=2)
-    
-    def _send_email_sync(self, to_email: str, subject: str, html_content: str, text_content: Optional[str] = None):
-        """Send email synchronously"""
-        if not self.enabled:
-            logger.info(f"Email service disabled. Would send email to {to_email}: {subject}")
-            return
-        
-        try:
-            # Create message
-            message = MIMEMultipart("alternative")
-            message["Subject"] = subject
-            message["From"] = f"{self.from_name} <{self.from_email}>"
-            message["To"] = to_email
-            
-            # Add text content
-            if text_content:
-                text_part = MIMEText(text_content, "plain")
-                message.attach(text_part)
-            
-            # Add HTML content
-            html_part = MIMEText(html_content, "html")
-            message.attach(html_part)
-            
-            # Create SSL context
-            context = ssl.create_default_context()
-            
-            # Send email
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls(context=context)
-                server.login(self.smtp_username, self.smtp_password)
-                server.sendmail(self.from_email, to_email, message.as_string())
-            
-            logger.info(f"Email sent successfully to {to_email}")
-            
-        except Exception as e:
-            logger.error(f"Failed to send email to {to_email}: {e}")
-            raise
-    
-    async def send_email(self, to_email: str, subject: str, html_content: str, text_content: Optional[str] = None):
-        """Send email asynchronously"""
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            self.executor,
-            self._send_email_sync,
-            to_email,
-            subject,
-            html_content,
-            text_content
-        )
-    
-    async def send_password_reset_email(self, email: str, token: str, user_name: Optional[str] = None):
-        """Send password reset email"""
-        reset_url = f"{getattr(settings, 'frontend_url', 'http://localhost:3000')}/reset-password?token={token}"
-        
-        name = user_name or email.split('@')[0]
-        
-        html_content = f"""
+@lru_cache(maxsize=None)
+def _message_policy():
+    """CRLF line endings for SMTP; 7bit keeps ASCII bodies unencoded and
+    encodes anything else, so no 8BITMIME support is needed from the server"""
+    from email import policy
+    return policy.SMTP.clone(cte_type="7bit")
+
+# (epoch second, formatted UTC time) of the last timestamp rendered into an email
+_timestamp_cache = (0, "")
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as shown in emails, formatted at most once per second"""
+    global _timestamp_cache
+    now = int(time.time())
+    second, text = _timestamp_cache
+    if second != now:
+        text = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(now))
+        # Tuple swap is atomic, so worker threads never see a torn pair
+        _timestamp_cache = (now, text)
+    return text
+
+
+# Message bodies, formatted with str.format_map at send time
+_RESET_HTML_TMPL = """
         <!DOCTYPE html>
         <html>
         <head>
@@ -131,15 +90,15 @@ class EmailService:
                     <p>If you continue to have problems, please contact our support team.</p>
                 </div>
                 <div class="footer">
-                    <p>This email was sent by DNSMate at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} UTC</p>
+                    <p>This email was sent by DNSMate at {now} UTC</p>
                     <p>If you didn't request this, you can safely ignore this email.</p>
                 </div>
             </div>
         </body>
         </html>
         """
-        
-        text_content = f"""
+
+_RESET_TEXT_TMPL = """
         DNSMate - Password Reset Request
         
         Hello {name},
@@ -155,21 +114,8 @@ class EmailService:
         Best regards,
         DNSMate Team
         """
-        
-        await self.send_email(
-            to_email=email,
-            subject="Reset your DNSMate password",
-            html_content=html_content,
-            text_content=text_content
-        )
-    
-    async def send_verification_email(self, email: str, token: str, user_name: Optional[str] = None):
-        """Send email verification email"""
-        verify_url = f"{getattr(settings, 'frontend_url', 'http://localhost:3000')}/verify-email?token={token}"
-        
-        name = user_name or email.split('@')[0]
-        
-        html_content = f"""
+
+_VERIFY_HTML_TMPL = """
         <!DOCTYPE html>
         <html>
         <head>
@@ -217,15 +163,15 @@ class EmailService:
                     <p>If you didn't create this account, you can safely ignore this email.</p>
                 </div>
                 <div class="footer">
-                    <p>This email was sent by DNSMate at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} UTC</p>
+                    <p>This email was sent by DNSMate at {now} UTC</p>
                     <p>Need help? Contact our support team.</p>
                 </div>
             </div>
         </body>
         </html>
         """
-        
-        text_content = f"""
+
+_VERIFY_TEXT_TMPL = """
         DNSMate - Email Verification
         
         Hello {name},
@@ -242,19 +188,8 @@ class EmailService:
         Best regards,
         DNSMate Team
         """
-        
-        await self.send_email(
-            to_email=email,
-            subject="Verify your DNSMate email address",
-            html_content=html_content,
-            text_content=text_content
-        )
-    
-    async def send_security_alert(self, email: str, event: str, ip_address: str, user_name: Optional[str] = None):
-        """Send security alert email"""
-        name = user_name or email.split('@')[0]
-        
-        html_content = f"""
+
+_ALERT_HTML_TMPL = """
         <!DOCTYPE html>
         <html>
         <head>
@@ -282,7 +217,7 @@ class EmailService:
                     <div class="alert">
                         <strong>Event:</strong> {event}<br>
                         <strong>IP Address:</strong> {ip_address}<br>
-                        <strong>Time:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} UTC
+                        <strong>Time:</strong> {now} UTC
                     </div>
                     
                     <p><strong>If this was you:</strong> No action is needed.</p>
@@ -303,6 +238,180 @@ class EmailService:
         </body>
         </html>
         """
+
+
+class EmailService:
+    """Email service for sending notifications"""
+    
+    def __init__(self):
+        self.smtp_server = getattr(settings, 'smtp_server', 'smtp.gmail.com')
+        self.smtp_port = getattr(settings, 'smtp_port', 587)
+        self.smtp_username = getattr(settings, 'smtp_username', '')
+        self.smtp_password = getattr(settings, 'smtp_password', '')
+        self.from_email = getattr(settings, 'from_email', 'noreply@dnsmate.com')
+        self.from_name = getattr(settings, 'from_name', 'DNSMate')
+        self.enabled = getattr(settings, 'email_enabled', False)
+        self._from_header = f"{self.from_name} <{self.from_email}>"
+        # Loading the CA bundle is costly; built on first connect and reused
+        self._ssl_context: Optional["ssl.SSLContext"] = None
+        
+        # One persistent SMTP session reused across sends, guarded for the worker threads
+        self._smtp_lock = threading.Lock()
+        self._smtp: Optional["smtplib.SMTP"] = None
+    
+    def _connect(self) -> "smtplib.SMTP":
+        """Open an authenticated SMTP session"""
+        import smtplib
+        import ssl
+        
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        try:
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            server.starttls(context=self._ssl_context)
+            server.login(self.smtp_username, self.smtp_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+    
+    def _get_connection(self) -> "smtplib.SMTP":
+        """Return the pooled session, reconnecting if it has gone away (lock must be held)"""
+        import smtplib
+        
+        if self._smtp is not None:
+            try:
+                self._smtp.noop()
+                return self._smtp
+            except (smtplib.SMTPException, OSError):
+                self._smtp.close()
+                self._smtp = None
+        
+        self._smtp = self._connect()
+        return self._smtp
+    
+    def close(self):
+        """Close the pooled SMTP session"""
+        with self._smtp_lock:
+            if self._smtp is None:
+                return
+            import smtplib
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                self._smtp.close()
+            self._smtp = None
+    
+    def _send_email_sync(self, to_email: str, subject: str, html_content: str, text_content: Optional[str] = None):
+        """Send email synchronously"""
+        if not self.enabled:
+            logger.info(f"Email service disabled. Would send email to {to_email}: {subject}")
+            return
+        
+        import smtplib
+        from email.message import EmailMessage
+        
+        try:
+            # Create message: text/plain with an HTML alternative, or HTML only
+            message = EmailMessage(policy=_message_policy())
+            message["Subject"] = subject
+            message["From"] = self._from_header
+            message["To"] = to_email
+            
+            if text_content:
+                message.set_content(text_content)
+                message.add_alternative(html_content, subtype="html")
+            else:
+                message.set_content(html_content, subtype="html")
+            
+            # Send email over the pooled session; retry once on a fresh one if the server dropped it
+            payload = bytes(message)
+            with self._smtp_lock:
+                server = self._get_connection()
+                try:
+                    server.sendmail(self.from_email, to_email, payload)
+                except smtplib.SMTPServerDisconnected:
+                    server.close()
+                    self._smtp = None
+                    self._get_connection().sendmail(self.from_email, to_email, payload)
+            
+            logger.info(f"Email sent successfully to {to_email}")
+            
+        except Exception as e:
+            logger.error(f"Failed to send email to {to_email}: {e}")
+            raise
+    
+    async def send_email(self, to_email: str, subject: str, html_content: str, text_content: Optional[str] = None):
+        """Send email asynchronously"""
+        # No thread hop when there is nothing to send
+        if not self.enabled:
+            logger.info(f"Email service disabled. Would send email to {to_email}: {subject}")
+            return
+        
+        await asyncio.to_thread(self._send_email_sync, to_email, subject, html_content, text_content)
+    
+    async def send_password_reset_email(self, email: str, token: str, user_name: Optional[str] = None):
+        """Send password reset email"""
+        # Skip rendering the templates when nothing will be sent
+        if not self.enabled:
+            logger.info(f"Email service disabled. Would send password reset email to {email}")
+            return
+        
+        reset_url = f"{getattr(settings, 'frontend_url', 'http://localhost:3000')}/reset-password?token={token}"
+        
+        name = user_name or email.split('@')[0]
+        fields = {"name": name, "reset_url": reset_url, "now": _utc_timestamp()}
+        
+        html_content = _RESET_HTML_TMPL.format_map(fields)
+        
+        text_content = _RESET_TEXT_TMPL.format_map(fields)
+        
+        await self.send_email(
+            to_email=email,
+            subject="Reset your DNSMate password",
+            html_content=html_content,
+            text_content=text_content
+        )
+    
+    async def send_verification_email(self, email: str, token: str, user_name: Optional[str] = None):
+        """Send email verification email"""
+        # Skip rendering the templates when nothing will be sent
+        if not self.enabled:
+            logger.info(f"Email service disabled. Would send verification email to {email}")
+            return
+        
+        verify_url = f"{getattr(settings, 'frontend_url', 'http://localhost:3000')}/verify-email?token={token}"
+        
+        name = user_name or email.split('@')[0]
+        fields = {"name": name, "verify_url": verify_url, "now": _utc_timestamp()}
+        
+        html_content = _VERIFY_HTML_TMPL.format_map(fields)
+        
+        text_content = _VERIFY_TEXT_TMPL.format_map(fields)
+        
+        await self.send_email(
+            to_email=email,
+            subject="Verify your DNSMate email address",
+            html_content=html_content,
+            text_content=text_content
+        )
+    
+    async def send_security_alert(self, email: str, event: str, ip_address: str, user_name: Optional[str] = None):
+        """Send security alert email"""
+        # Skip rendering the templates when nothing will be sent
+        if not self.enabled:
+            logger.info(f"Email service disabled. Would send security alert email to {email}")
+            return
+        
+        name = user_name or email.split('@')[0]
+        fields = {
+            "name": name,
+            "event": event,
+            "ip_address": ip_address,
+            "now": _utc_timestamp()
+        }
+        
+        html_content = _ALERT_HTML_TMPL.format_map(fields)
         
         await self.send_email(
             to_email=email,
@@ -311,5 +420,9 @@ class EmailService:
         )
 
 
-# Global email service instance
-email_service = EmailService()
+@lru_cache(maxsize=1)
+def get_email_service() -> EmailService:
+    """Shared email service, created on first use - FastAPI dependency compatible"""
+    service = EmailService()
+    atexit.register(service.close)
+    return service
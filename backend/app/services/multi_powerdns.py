@@ -3,13 +3,17 @@
 import asyncio
 import logging
 import time
-from typing import List, Dict, Any, Optional, Callable, Set
+import httpx
+from collections import defaultdict, deque
+from typing import List, Dict, Any, Optional, Callable, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.database import async_session_maker
 
 from app.services.powerdns import PowerDNSClient, PowerDNSRecord
-from app.services.settings import PowerDNSSettingsService
+from app.services.settings import PowerDNSSettingsService, powerdns_settings_revision
 from app.models.settings import PowerDNSSettings
 
 logger = logging.getLogger(__name__)
@@ -25,10 +29,13 @@ class CircuitState(Enum):
 @dataclass
 class CircuitBreaker:
     """Simple circuit breaker for server reliability"""
+    # All breaker methods are synchronous and never await, so on the event loop each
+    # read-modify-write runs to completion before another coroutine can touch the
+    # breaker; concurrent fan-outs to the same server therefore need no lock.
     failure_threshold: int = 5
     recovery_timeout: int = 60  # seconds
     failure_count: int = field(default=0)
-    last_failure_time: float = field(default=0)
+    last_failure_time: float = field(default=0)  # time.monotonic(); unaffected by wall-clock jumps
     state: CircuitState = field(default=CircuitState.CLOSED)
     successful_calls: int = field(default=0)
     
@@ -37,7 +44,7 @@ class CircuitBreaker:
         if self.state == CircuitState.CLOSED:
             return True
         elif self.state == CircuitState.OPEN:
-            if time.time() - self.last_failure_time > self.recovery_timeout:
+            if time.monotonic() - self.last_failure_time > self.recovery_timeout:
                 self.state = CircuitState.HALF_OPEN
                 return True
             return False
@@ -54,36 +61,77 @@ class CircuitBreaker:
     def record_failure(self):
         """Record failed operation"""
         self.failure_count += 1
-        self.last_failure_time = time.time()
+        self.last_failure_time = time.monotonic()
         if self.failure_count >= self.failure_threshold:
             self.state = CircuitState.OPEN
 
 
+def _is_server_failure(error: BaseException) -> bool:
+    """Whether an error reflects on the server's health rather than on the request
+    
+    Only timeouts, transport errors and 5xx responses count; a 4xx response or a
+    client-side validation error means this request was bad, not the server.
+    PowerDNSClient wraps HTTP errors, so the cause chain is inspected too.
+    """
+    while error is not None:
+        if isinstance(error, (TimeoutError, httpx.TransportError)):
+            return True
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code >= 500
+        error = error.__cause__
+    return False
+
+
+@dataclass(slots=True)
+class ServerOpResult:
+    """Outcome of one operation on one server"""
+    server_name: str
+    server_id: int
+    success: bool
+    result: Any
+    error: Optional[str]
+    response_time_ms: float
+    timestamp: float
+
+
+@dataclass(slots=True)
+class SettingsSnapshot:
+    """Active PowerDNS settings plus the dispatch facts derived from them"""
+    fetched_at: float  # time.monotonic()
+    revision: int
+    servers: List[PowerDNSSettings]
+    default_server: Optional[PowerDNSSettings]
+    multi_enabled: bool
+
+
 class MultiPowerDNSResult:
     """Enhanced result tracking for multi-server operations"""
-    def __init__(self):
-        self.results: List[Dict[str, Any]] = []
+    def __init__(self, *, track_details: bool = True):
+        # Without details only the counters and aggregates are kept, not the per-server entries
+        self.track_details = track_details
+        self.results: List[ServerOpResult] = []
         self.success_count = 0
         self.failure_count = 0
         self.total_servers = 0
         self.execution_time_ms = 0
         self.operation_metadata: Dict[str, Any] = {}
+        # Aggregates maintained in add_result so the summary properties stay O(1)
+        self._response_time_sum = 0.0
+        self._fastest: Optional[Tuple[str, float]] = None
     
     def add_result(self, server_name: str, server_id: int, success: bool, 
                    result: Any = None, error: str = None, response_time_ms: float = 0):
         """Add a server operation result with enhanced metrics"""
-        self.results.append({
-            "server_name": server_name,
-            "server_id": server_id,
-            "success": success,
-            "result": result,
-            "error": error,
-            "response_time_ms": response_time_ms,
-            "timestamp": time.time()
-        })
+        if self.track_details:
+            self.results.append(ServerOpResult(
+                server_name, server_id, success, result, error, response_time_ms, time.time()
+            ))
         
+        self._response_time_sum += response_time_ms
         if success:
             self.success_count += 1
+            if self._fastest is None or response_time_ms < self._fastest[1]:
+                self._fastest = (server_name, response_time_ms)
         else:
             self.failure_count += 1
         
@@ -107,26 +155,156 @@ class MultiPowerDNSResult:
     @property
     def average_response_time(self) -> float:
         """Calculate average response time across all operations"""
-        if not self.results:
-            return 0.0
-        return sum(r.get("response_time_ms", 0) for r in self.results) / len(self.results)
+        return self._response_time_sum / self.total_servers if self.total_servers else 0.0
     
     def get_fastest_server(self) -> Optional[str]:
         """Get the server with fastest response time"""
-        successful_results = [r for r in self.results if r["success"]]
-        if not successful_results:
-            return None
-        return min(successful_results, key=lambda x: x.get("response_time_ms", float('inf')))["server_name"]
+        return self._fastest[0] if self._fastest else None
 
 
 class MultiPowerDNSService:
     """Enhanced service for managing multiple PowerDNS servers"""
     
-    def __init__(self):
+    # How long a replaced client stays open for the calls still running on it;
+    # longer than the default per-call timeout
+    client_retire_grace = 60.0
+    
+    def __init__(self, max_concurrency: int = 16, session_factory: async_sessionmaker = async_session_maker):
+        # Settings are read in short-lived sessions of our own, never in the caller's
+        # request session, so the service neither opens nor ends the caller's transaction
+        self.session_factory = session_factory
         self.settings_service = PowerDNSSettingsService()
         self.circuit_breakers: Dict[int, CircuitBreaker] = {}
-        self.operation_cache: Dict[str, Any] = {}
-        self.performance_metrics: Dict[int, List[float]] = {}
+        # Last 100 response times per server, plus their running sum for O(1) averages
+        self.performance_metrics: Dict[int, deque] = {}
+        self._metric_sums: Dict[int, float] = {}
+        # server_id -> (connection settings, client); clients keep their connections alive between calls
+        self._client_pool: Dict[int, Tuple[Tuple[Any, ...], PowerDNSClient]] = {}
+        # Delayed closes of clients that were replaced or whose server was removed
+        self._retiring: Dict[asyncio.Task, PowerDNSClient] = {}
+        # Settings change far less often than records; concurrent misses share one query
+        self._settings_cache: Optional[SettingsSnapshot] = None
+        self._settings_lock = asyncio.Lock()
+        # Background task keeping the settings snapshot current so writes never query settings
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._refresh_interval = 10.0
+        # Caps in-flight PowerDNS calls across all fan-outs so large fleets or bulk
+        # imports cannot open hundreds of connections at once
+        self._fanout_semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def _get_client(self, server: PowerDNSSettings) -> PowerDNSClient:
+        """Get the pooled client for a server, replacing it if any setting it was built from changed"""
+        timeout = server.timeout or 30
+        verify = server.verify_ssl if server.verify_ssl is not None else True
+        key = (server.api_url, server.api_key, timeout, verify)
+        pooled = self._client_pool.get(server.id)
+        if pooled is not None and pooled[0] == key:
+            return pooled[1]
+        
+        # No await until the new entry is installed, so concurrent callers agree on one client
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=32),
+            timeout=timeout,
+            verify=verify
+        )
+        client = PowerDNSClient(server.api_url, server.api_key, http_client=http_client)
+        self._client_pool[server.id] = (key, client)
+        if pooled is not None:
+            self._retire_client(pooled[1])
+        return client
+    
+    def _retire_client(self, client: PowerDNSClient):
+        """Close a client once the calls still running on it have had time to finish"""
+        task = asyncio.get_running_loop().create_task(self._close_client_later(client))
+        self._retiring[task] = client
+        task.add_done_callback(lambda done: self._retiring.pop(done, None))
+    
+    async def _close_client_later(self, client: PowerDNSClient):
+        await asyncio.sleep(self.client_retire_grace)
+        await client.aclose()
+    
+    def start_settings_refresh(self, interval: float = 10.0):
+        """Start refreshing the settings snapshot in the background on the running loop"""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_interval = interval
+        self._refresh_task = asyncio.get_running_loop().create_task(self._refresh_settings_loop(interval))
+    
+    async def _refresh_settings_loop(self, interval: float):
+        while True:
+            try:
+                await self._load_settings()
+            except Exception as e:
+                logger.error(f"Failed to refresh PowerDNS settings: {e}")
+            await asyncio.sleep(interval)
+    
+    async def close(self):
+        """Stop the settings refresh and close all pooled PowerDNS clients"""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+        
+        pool, self._client_pool = self._client_pool, {}
+        for _, client in pool.values():
+            await client.aclose()
+        
+        # Shutting down: no grace period for replaced clients
+        retiring, self._retiring = self._retiring, {}
+        for task, client in retiring.items():
+            task.cancel()
+            await client.aclose()
+    
+    async def _load_settings(self) -> SettingsSnapshot:
+        """Read the active PowerDNS settings and store them as the current snapshot"""
+        revision = powerdns_settings_revision()
+        async with self.session_factory() as db:
+            servers = list(await self.settings_service.get_powerdns_settings(db))
+        # Same choice as get_default_powerdns_setting: the flagged default, else the lowest id
+        default_server = next((s for s in servers if s.is_default), None)
+        if default_server is None and servers:
+            default_server = min(servers, key=lambda s: s.id)
+        snapshot = SettingsSnapshot(
+            fetched_at=time.monotonic(),
+            revision=revision,
+            servers=servers,
+            default_server=default_server,
+            multi_enabled=sum(1 for s in servers if s.multi_server_mode) > 1
+        )
+        self._settings_cache = snapshot
+        return snapshot
+    
+    def _snapshot_is_fresh(self, snapshot: Optional[SettingsSnapshot], ttl: float) -> bool:
+        # Local settings changes always force a re-read. Otherwise the refresh task
+        # keeps the snapshot current, but only up to a few missed refreshes so a
+        # failing loop cannot serve the same snapshot forever; without it the TTL applies
+        if snapshot is None or snapshot.revision != powerdns_settings_revision():
+            return False
+        if self._refresh_task is not None:
+            ttl = max(ttl, 3 * self._refresh_interval)
+        return time.monotonic() - snapshot.fetched_at < ttl
+    
+    async def _get_settings_snapshot(self, ttl: float = 5.0) -> SettingsSnapshot:
+        """Current settings snapshot, re-read only when it may be stale"""
+        if self._snapshot_is_fresh(self._settings_cache, ttl):
+            return self._settings_cache
+        
+        async with self._settings_lock:
+            # Another coroutine may have reloaded while we waited
+            if self._snapshot_is_fresh(self._settings_cache, ttl):
+                return self._settings_cache
+            return await self._load_settings()
+    
+    async def _get_settings_cached(self, ttl: float = 5.0) -> List[PowerDNSSettings]:
+        """Active PowerDNS settings from the snapshot"""
+        return (await self._get_settings_snapshot(ttl)).servers
+    
+    def invalidate_settings_cache(self):
+        """Drop the cached PowerDNS settings"""
+        self._settings_cache = None
     
     def _get_circuit_breaker(self, server_id: int) -> CircuitBreaker:
         """Get or create circuit breaker for server"""
@@ -137,9 +315,7 @@ class MultiPowerDNSService:
     async def should_use_multi_server(self, db: AsyncSession) -> bool:
         """Check if multi-server mode is enabled with enhanced logic"""
         try:
-            settings = await self.settings_service.get_powerdns_settings(db)
-            active_multi_servers = [s for s in settings if s.multi_server_mode and s.is_active]
-            return len(active_multi_servers) > 1
+            return (await self._get_settings_snapshot()).multi_enabled
         except Exception as e:
             logger.error(f"Error checking multi-server mode: {e}")
             return False
@@ -147,157 +323,164 @@ class MultiPowerDNSService:
     async def get_active_servers(self, db: AsyncSession) -> List[PowerDNSSettings]:
         """Get all active PowerDNS servers with health filtering"""
         try:
-            all_servers = await self.settings_service.get_powerdns_settings(db)
-            healthy_servers = []
-            
-            for server in all_servers:
-                if not server.is_active:
-                    continue
-                
-                circuit_breaker = self._get_circuit_breaker(server.id)
-                if circuit_breaker.can_execute():
-                    healthy_servers.append(server)
-                else:
-                    logger.warning(f"Server {server.name} circuit breaker is open, skipping")
-            
-            return healthy_servers
+            return self._filter_healthy(await self._get_settings_cached())
         except Exception as e:
             logger.error(f"Error getting active servers: {e}")
             return []
     
+    def _filter_healthy(self, servers: List[PowerDNSSettings]) -> List[PowerDNSSettings]:
+        """Active servers whose circuit breaker allows a call"""
+        healthy_servers = []
+        
+        for server in servers:
+            if not server.is_active:
+                continue
+            
+            circuit_breaker = self._get_circuit_breaker(server.id)
+            if circuit_breaker.can_execute():
+                healthy_servers.append(server)
+            else:
+                logger.warning(f"Server {server.name} circuit breaker is open, skipping")
+        
+        return healthy_servers
+    
+    async def _load_dispatch_state(self) -> Tuple[List[PowerDNSSettings], Optional[PowerDNSSettings], bool]:
+        """Healthy servers, default server and multi-server flag from a single settings read"""
+        snapshot = await self._get_settings_snapshot()
+        return self._filter_healthy(snapshot.servers), snapshot.default_server, snapshot.multi_enabled
+    
     async def _execute_on_server_with_metrics(
         self, 
         server: PowerDNSSettings, 
-        operation_func: Callable,
+        result: MultiPowerDNSResult,
+        method_name: str,
         *args, 
+        metrics: Dict[int, List[float]],
+        timeout: float = 30,
+        use_circuit_breaker: bool = True,
         **kwargs
-    ) -> Dict[str, Any]:
-        """Execute operation on server with performance tracking"""
-        circuit_breaker = self._get_circuit_breaker(server.id)
-        start_time = time.time()
-        
-        try:
-            if not circuit_breaker.can_execute():
-                raise Exception(f"Circuit breaker open for server {server.name}")
+    ):
+        """Execute operation on server, recording the outcome in result and the latency in metrics"""
+        # Bound concurrent PowerDNS calls; waiting for a slot does not count against the timeout
+        async with self._fanout_semaphore:
+            circuit_breaker = self._get_circuit_breaker(server.id) if use_circuit_breaker else None
+            start_ns = time.perf_counter_ns()
             
-            client = PowerDNSClient(server.api_url, server.api_key)
-            result = await operation_func(client, *args, **kwargs)
+            try:
+                if circuit_breaker is not None and not circuit_breaker.can_execute():
+                    raise Exception(f"Circuit breaker open for server {server.name}")
             
-            response_time = (time.time() - start_time) * 1000  # ms
-            circuit_breaker.record_success()
+                client = await self._get_client(server)
+                async with asyncio.timeout(timeout):
+                    operation_result = await getattr(client, method_name)(*args, **kwargs)
             
-            # Track performance metrics
-            if server.id not in self.performance_metrics:
-                self.performance_metrics[server.id] = []
-            self.performance_metrics[server.id].append(response_time)
+                response_time = (time.perf_counter_ns() - start_ns) / 1_000_000  # ms
+                if circuit_breaker is not None:
+                    circuit_breaker.record_success()
             
-            # Keep only last 100 measurements
-            if len(self.performance_metrics[server.id]) > 100:
-                self.performance_metrics[server.id] = self.performance_metrics[server.id][-100:]
+                # Track performance metrics locally; the caller merges them after the fan-out
+                metrics[server.id].append(response_time)
             
-            return {
-                "success": True,
-                "result": result,
-                "error": None,
-                "response_time_ms": response_time
-            }
+                result.add_result(server.name, server.id, True, operation_result, response_time_ms=response_time)
             
-        except Exception as e:
-            response_time = (time.time() - start_time) * 1000
-            circuit_breaker.record_failure()
-            logger.error(f"Operation failed on server {server.name}: {e}")
+            except Exception as e:
+                response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
+                # Per-request errors (bad records, 4xx) must not trip the breaker for valid requests
+                if circuit_breaker is not None and _is_server_failure(e):
+                    circuit_breaker.record_failure()
+                error = f"Operation timed out after {timeout}s" if isinstance(e, TimeoutError) else str(e)
+                logger.debug("Operation failed on server %s: %s", server.name, error)
             
-            return {
-                "success": False,
-                "result": None,
-                "error": str(e),
-                "response_time_ms": response_time
-            }
+                result.add_result(server.name, server.id, False, error=error, response_time_ms=response_time)
     
     async def execute_on_all_servers(
         self, 
         db: AsyncSession, 
-        operation_func: Callable,
+        method_name: str,
         *args,
+        servers: Optional[List[PowerDNSSettings]] = None,
+        track_details: bool = True,
+        use_circuit_breaker: bool = True,
         **kwargs
     ) -> MultiPowerDNSResult:
-        """Execute operation on all active servers with enhanced error handling"""
-        start_time = time.time()
-        servers = await self.get_active_servers(db)
-        result = MultiPowerDNSResult()
+        """Execute a PowerDNSClient method on all active servers with enhanced error handling"""
+        start_ns = time.perf_counter_ns()
+        if servers is None:
+            servers = await self.get_active_servers(db)
+        result = MultiPowerDNSResult(track_details=track_details)
         
         if not servers:
             logger.warning("No active PowerDNS servers found")
             return result
         
-        # Prepare concurrent tasks with timeout
+        # Each server gets its own timeout, so one slow server cannot cancel the others.
+        # Every call records its own outcome as soon as it finishes, so gather() only
+        # collects None and no task-to-server bookkeeping is needed.
         timeout = kwargs.pop('timeout', 30)  # Default 30 second timeout
-        tasks = []
-        
-        for server in servers:
-            task = asyncio.create_task(
-                self._execute_on_server_with_metrics(server, operation_func, *args, **kwargs)
+        metrics: Dict[int, List[float]] = defaultdict(list)
+        await asyncio.gather(*[
+            self._execute_on_server_with_metrics(
+                server, result, method_name, *args,
+                metrics=metrics, timeout=timeout, use_circuit_breaker=use_circuit_breaker, **kwargs
             )
-            tasks.append((server, task))
-        
-        # Execute with timeout protection
-        try:
-            results_list = await asyncio.wait_for(
-                asyncio.gather(*[task for _, task in tasks], return_exceptions=True),
-                timeout=timeout
-            )
-        except asyncio.TimeoutError:
-            logger.error(f"Multi-server operation timed out after {timeout}s")
-            # Cancel pending tasks
-            for _, task in tasks:
-                if not task.done():
-                    task.cancel()
-            results_list = [Exception("Operation timed out") for _ in tasks]
-        
-        # Process results
-        for (server, _), operation_result in zip(tasks, results_list):
-            try:
-                if isinstance(operation_result, Exception):
-                    raise operation_result
-                
-                result.add_result(
-                    server_name=server.name,
-                    server_id=server.id,
-                    success=operation_result["success"],
-                    result=operation_result["result"],
-                    error=operation_result["error"],
-                    response_time_ms=operation_result["response_time_ms"]
-                )
-                
-            except Exception as e:
-                logger.error(f"Failed to execute operation on server {server.name}: {e}")
-                result.add_result(
-                    server_name=server.name,
-                    server_id=server.id,
-                    success=False,
-                    result=None,
-                    error=str(e),
-                    response_time_ms=0
-                )
+            for server in servers
+        ])
+        self._merge_response_times(metrics)
         
-        result.execution_time_ms = (time.time() - start_time) * 1000
+        result.execution_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
         
-        # Log operation summary
-        logger.info(
-            f"Multi-server operation completed: {result.success_count}/{result.total_servers} succeeded "
-            f"in {result.execution_time_ms:.1f}ms"
-        )
+        # One summary line per fan-out; per-server failures are only logged at debug level
+        if result.failure_count and result.track_details:
+            logger.info(
+                "Multi-server operation completed: %d/%d succeeded in %.1fms; failed: %s",
+                result.success_count, result.total_servers, result.execution_time_ms,
+                ", ".join(f"{r.server_name} ({r.error})" for r in result.results if not r.success)
+            )
+        else:
+            logger.info(
+                "Multi-server operation completed: %d/%d succeeded in %.1fms",
+                result.success_count, result.total_servers, result.execution_time_ms
+            )
         
         return result
     
-    async def get_server_performance_metrics(self, server_id: int) -> Dict[str, float]:
+    def _record_response_time(self, server_id: int, response_time: float):
+        """Add a measurement to the server's window, keeping the running sum in step"""
+        metrics = self.performance_metrics.get(server_id)
+        if metrics is None:
+            metrics = self.performance_metrics[server_id] = deque(maxlen=100)
+            self._metric_sums[server_id] = 0.0
+        # A full window evicts its oldest entry on append
+        if len(metrics) == metrics.maxlen:
+            self._metric_sums[server_id] -= metrics[0]
+        metrics.append(response_time)
+        self._metric_sums[server_id] += response_time
+    
+    def _prune_removed_servers(self, known_ids: Set[int]):
+        """Drop breakers, metrics and pooled clients of servers no longer configured"""
+        stale_ids = (self.circuit_breakers.keys() | self.performance_metrics.keys() | self._client_pool.keys()) - known_ids
+        for server_id in stale_ids:
+            self.circuit_breakers.pop(server_id, None)
+            self.performance_metrics.pop(server_id, None)
+            self._metric_sums.pop(server_id, None)
+            pooled = self._client_pool.pop(server_id, None)
+            if pooled is not None:
+                self._retire_client(pooled[1])
+    
+    def _merge_response_times(self, metrics: Dict[int, List[float]]):
+        """Fold the response times collected during one fan-out into the per-server windows"""
+        for server_id, response_times in metrics.items():
+            for response_time in response_times:
+                self._record_response_time(server_id, response_time)
+    
+    def get_server_performance_metrics(self, server_id: int) -> Dict[str, float]:
         """Get performance metrics for a specific server"""
         if server_id not in self.performance_metrics:
             return {"avg_response_time": 0.0, "total_calls": 0}
         
         metrics = self.performance_metrics[server_id]
         return {
-            "avg_response_time": sum(metrics) / len(metrics) if metrics else 0.0,
+            "avg_response_time": self._metric_sums[server_id] / len(metrics) if metrics else 0.0,
             "min_response_time": min(metrics) if metrics else 0.0,
             "max_response_time": max(metrics) if metrics else 0.0,
             "total_calls": len(metrics)
@@ -305,7 +488,8 @@ class MultiPowerDNSService:
     
     async def get_health_status(self, db: AsyncSession) -> Dict[str, Any]:
         """Get overall health status of all servers"""
-        servers = await self.settings_service.get_powerdns_settings(db)
+        servers = await self._get_settings_cached()
+        self._prune_removed_servers({s.id for s in servers})
         health_data = {
             "total_servers": len(servers),
             "active_servers": len([s for s in servers if s.is_active]),
@@ -327,25 +511,27 @@ class MultiPowerDNSService:
                     health_data["healthy_servers"] += 1
             
             # Add performance metrics
-            metrics = await self.get_server_performance_metrics(server.id)
-            health_data["performance_summary"][server.name] = metrics
+            health_data["performance_summary"][server.name] = self.get_server_performance_metrics(server.id)
         
         return health_data
     
-    async def _execute_on_server(self, server: PowerDNSSettings, operation_func, *args, **kwargs):
-        """Execute operation on a single server"""
-        client = PowerDNSClient(
-            api_url=server.api_url,
-            api_key=server.api_key
-        )
+    async def _dispatch(self, db: AsyncSession, method_name: str, *args) -> MultiPowerDNSResult:
+        """Run a PowerDNSClient method on all active servers, or on the default server only
         
-        # If the operation function is a method of PowerDNSClient, bind it
-        if hasattr(client, operation_func.__name__):
-            bound_func = getattr(client, operation_func.__name__)
-            return await bound_func(*args, **kwargs)
-        else:
-            # For custom operations, pass the client as first argument
-            return await operation_func(client, *args, **kwargs)
+        The single default server is always called: with nothing to fail over to,
+        a circuit breaker would only turn its errors into refused writes.
+        """
+        servers, default_server, multi_enabled = await self._load_dispatch_state()
+        if not multi_enabled:
+            if not default_server:
+                result = MultiPowerDNSResult()
+                result.add_result("No default server", 0, False, error="No default PowerDNS server configured")
+                return result
+            servers = [default_server]
+        
+        return await self.execute_on_all_servers(
+            db, method_name, *args, servers=servers, use_circuit_breaker=multi_enabled
+        )
     
     async def add_record_to_all(
         self, 
@@ -355,39 +541,55 @@ class MultiPowerDNSService:
     ) -> MultiPowerDNSResult:
         """Add a DNS record to all active PowerDNS servers or default server based on settings"""
         
-        # Check if multi-server mode is enabled
-        if not await self.should_use_multi_server(db):
-            # Use default server only
-            default_server = await self.settings_service.get_default_powerdns_setting(db)
+        # Convert dict to PowerDNSRecord object once for every server
+        record = PowerDNSRecord(**record_data)
+        return await self._dispatch(db, "create_record", zone_name, record)
+    
+    async def add_records_to_all(
+        self, 
+        db: AsyncSession, 
+        records: List[Tuple[str, Dict[str, Any]]],
+        timeout: float = 30,
+        track_details: bool = True
+    ) -> List[MultiPowerDNSResult]:
+        """Add many (zone_name, record_data) pairs with one server lookup and a single fan-out"""
+        start_ns = time.perf_counter_ns()
+        prepared = [(zone_name, PowerDNSRecord(**record_data)) for zone_name, record_data in records]
+        results = [MultiPowerDNSResult(track_details=track_details) for _ in prepared]
+        
+        servers, default_server, multi_enabled = await self._load_dispatch_state()
+        if multi_enabled:
+            if not servers:
+                logger.warning("No active PowerDNS servers found")
+                return results
+        else:
             if not default_server:
-                result = MultiPowerDNSResult()
-                result.add_result("No default server", 0, False, error="No default PowerDNS server configured")
-                return result
-            
-            result = MultiPowerDNSResult()
-            try:
-                client = PowerDNSClient(api_url=default_server.api_url, api_key=default_server.api_key)
-                # Convert dict to PowerDNSRecord object
-                from app.services.powerdns import PowerDNSRecord
-                record = PowerDNSRecord(**record_data)
-                operation_result = await client.create_record(zone_name, record)
-                result.add_result(default_server.name, default_server.id, True, operation_result)
-            except Exception as e:
-                result.add_result(default_server.name, default_server.id, False, error=str(e))
-            return result
+                for result in results:
+                    result.add_result("No default server", 0, False, error="No default PowerDNS server configured")
+                return results
+            servers = [default_server]
+        
+        metrics: Dict[int, List[float]] = defaultdict(list)
+        await asyncio.gather(*[
+            self._execute_on_server_with_metrics(
+                server, result, "create_record", zone_name, record,
+                metrics=metrics, timeout=timeout, use_circuit_breaker=multi_enabled
+            )
+            for server in servers
+            for (zone_name, record), result in zip(prepared, results)
+        ])
+        self._merge_response_times(metrics)
         
-        async def add_record_operation(client: PowerDNSClient, zone: str, data: Dict[str, Any]):
-            # Convert dict to PowerDNSRecord object
-            from app.services.powerdns import PowerDNSRecord
-            record = PowerDNSRecord(**data)
-            return await client.create_record(zone, record)
+        execution_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        for result in results:
+            result.execution_time_ms = execution_time_ms
         
-        return await self.execute_on_all_servers(
-            db, 
-            add_record_operation, 
-            zone_name, 
-            record_data
+        logger.info(
+            "Bulk record add completed: %d records on %d servers, %d/%d operations succeeded in %.1fms",
+            len(results), len(servers), sum(r.success_count for r in results),
+            len(results) * len(servers), execution_time_ms
         )
+        return results
     
     async def update_record_on_all(
         self, 
@@ -397,33 +599,7 @@ class MultiPowerDNSService:
     ) -> MultiPowerDNSResult:
         """Update a DNS record on all active PowerDNS servers or default server based on settings"""
         
-        # Check if multi-server mode is enabled
-        if not await self.should_use_multi_server(db):
-            # Use default server only
-            default_server = await self.settings_service.get_default_powerdns_setting(db)
-            if not default_server:
-                result = MultiPowerDNSResult()
-                result.add_result("No default server", 0, False, error="No default PowerDNS server configured")
-                return result
-            
-            result = MultiPowerDNSResult()
-            try:
-                client = PowerDNSClient(api_url=default_server.api_url, api_key=default_server.api_key)
-                operation_result = await client.update_record(zone_name, record_data)
-                result.add_result(default_server.name, default_server.id, True, operation_result)
-            except Exception as e:
-                result.add_result(default_server.name, default_server.id, False, error=str(e))
-            return result
-        
-        async def update_record_operation(client: PowerDNSClient, zone: str, data: Dict[str, Any]):
-            return await client.update_record(zone, data)
-        
-        return await self.execute_on_all_servers(
-            db, 
-            update_record_operation, 
-            zone_name, 
-            record_data
-        )
+        return await self._dispatch(db, "update_record", zone_name, record_data)
     
     async def delete_record_from_all(
         self, 
@@ -434,34 +610,7 @@ class MultiPowerDNSService:
     ) -> MultiPowerDNSResult:
         """Delete a DNS record from all active PowerDNS servers or default server based on settings"""
         
-        # Check if multi-server mode is enabled
-        if not await self.should_use_multi_server(db):
-            # Use default server only
-            default_server = await self.settings_service.get_default_powerdns_setting(db)
-            if not default_server:
-                result = MultiPowerDNSResult()
-                result.add_result("No default server", 0, False, error="No default PowerDNS server configured")
-                return result
-            
-            result = MultiPowerDNSResult()
-            try:
-                client = PowerDNSClient(api_url=default_server.api_url, api_key=default_server.api_key)
-                operation_result = await client.delete_record(zone_name, record_name, record_type)
-                result.add_result(default_server.name, default_server.id, True, operation_result)
-            except Exception as e:
-                result.add_result(default_server.name, default_server.id, False, error=str(e))
-            return result
-        
-        async def delete_record_operation(client: PowerDNSClient, zone: str, name: str, rtype: str):
-            return await client.delete_record(zone, name, rtype)
-        
-        return await self.execute_on_all_servers(
-            db, 
-            delete_record_operation, 
-            zone_name, 
-            record_name, 
-            record_type
-        )
+        return await self._dispatch(db, "delete_record", zone_name, record_name, record_type)
     
     async def create_zone_on_all(
         self, 
@@ -470,32 +619,7 @@ class MultiPowerDNSService:
     ) -> MultiPowerDNSResult:
         """Create a DNS zone on all active PowerDNS servers or default server based on settings"""
         
-        # Check if multi-server mode is enabled
-        if not await self.should_use_multi_server(db):
-            # Use default server only
-            default_server = await self.settings_service.get_default_powerdns_setting(db)
-            if not default_server:
-                result = MultiPowerDNSResult()
-                result.add_result("No default server", 0, False, error="No default PowerDNS server configured")
-                return result
-            
-            result = MultiPowerDNSResult()
-            try:
-                client = PowerDNSClient(api_url=default_server.api_url, api_key=default_server.api_key)
-                operation_result = await client.create_zone(zone_data)
-                result.add_result(default_server.name, default_server.id, True, operation_result)
-            except Exception as e:
-                result.add_result(default_server.name, default_server.id, False, error=str(e))
-            return result
-        
-        async def create_zone_operation(client: PowerDNSClient, data: Dict[str, Any]):
-            return await client.create_zone(data)
-        
-        return await self.execute_on_all_servers(
-            db, 
-            create_zone_operation, 
-            zone_data
-        )
+        return await self._dispatch(db, "create_zone", zone_data)
     
     async def delete_zone_from_all(
         self, 
@@ -504,32 +628,7 @@ class MultiPowerDNSService:
     ) -> MultiPowerDNSResult:
         """Delete a DNS zone from all active PowerDNS servers or default server based on settings"""
         
-        # Check if multi-server mode is enabled
-        if not await self.should_use_multi_server(db):
-            # Use default server only
-            default_server = await self.settings_service.get_default_powerdns_setting(db)
-            if not default_server:
-                result = MultiPowerDNSResult()
-                result.add_result("No default server", 0, False, error="No default PowerDNS server configured")
-                return result
-            
-            result = MultiPowerDNSResult()
-            try:
-                client = PowerDNSClient(api_url=default_server.api_url, api_key=default_server.api_key)
-                operation_result = await client.delete_zone(zone_name)
-                result.add_result(default_server.name, default_server.id, True, operation_result)
-            except Exception as e:
-                result.add_result(default_server.name, default_server.id, False, error=str(e))
-            return result
-        
-        async def delete_zone_operation(client: PowerDNSClient, zone: str):
-            return await client.delete_zone(zone)
-        
-        return await self.execute_on_all_servers(
-            db, 
-            delete_zone_operation, 
-            zone_name
-        )
+        return await self._dispatch(db, "delete_zone", zone_name)
 
 
 # Global instance with enhanced features
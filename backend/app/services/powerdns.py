@@ -11,6 +11,28 @@ from app.services.settings import powerdns_settings_service
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive HTTP clients shared by PowerDNSClient instances that were not given one, keyed by API URL
+_shared_http_clients: Dict[str, httpx.AsyncClient] = {}
+
+
+def _get_shared_http_client(api_url: str) -> httpx.AsyncClient:
+    """Get (or create) the pooled HTTP client for a PowerDNS API URL"""
+    client = _shared_http_clients.get(api_url)
+    if client is None or client.is_closed:
+        client = _shared_http_clients[api_url] = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            timeout=httpx.Timeout(5.0, connect=2.0)
+        )
+    return client
+
+
+async def close_shared_http_clients() -> None:
+    """Close every shared PowerDNS HTTP client (application shutdown)"""
+    clients = list(_shared_http_clients.values())
+    _shared_http_clients.clear()
+    for client in clients:
+        await client.aclose()
+
 
 class PowerDNSZone(BaseModel):
     """PowerDNS Zone model"""
@@ -34,13 +56,28 @@ class PowerDNSRecord(BaseModel):
 class PowerDNSClient:
     """PowerDNS API client"""
     
-    def __init__(self, api_url: str = None, api_key: str = None):
+    def __init__(self, api_url: str = None, api_key: str = None, http_client: Optional[httpx.AsyncClient] = None):
         self.api_url = api_url or settings.powerdns_api_url
         self.api_key = api_key or settings.powerdns_api_key
         self.headers = {
             "X-API-Key": self.api_key,
             "Content-Type": "application/json"
         }
+        # Long-lived HTTP client supplied by the owner; without one the shared
+        # keep-alive client for this API URL is used
+        self._http_client = http_client
+    
+    async def __aenter__(self) -> "PowerDNSClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the injected HTTP client, if any (shared clients stay open)"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
     
     async def _request(self, method: str, endpoint: str, data: Dict[str, Any] = None) -> Dict[str, Any]:
         """Make HTTP request to PowerDNS API"""
@@ -49,43 +86,47 @@ class PowerDNSClient:
             
         url = f"{self.api_url}/api/v1/{endpoint}"
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    headers=self.headers,
-                    json=data
-                )
-                response.raise_for_status()
-                return response.json() if response.content else {}
-            except httpx.HTTPStatusError as e:
-                # Log the error details for debugging
-                error_detail = f"PowerDNS API error: {e.response.status_code} {e.response.reason_phrase}"
-                
-                if e.response.content:
-                    try:
-                        error_body = e.response.json()
-                        error_detail += f" - {error_body}"
-                        
-                        # For 422 errors, provide more specific guidance
-                        if e.response.status_code == 422:
-                            if "error" in error_body:
-                                error_msg = error_body["error"]
-                                if "RRset" in error_msg or "rrset" in error_msg:
-                                    error_detail = f"Record format error: {error_msg}. Check record name, type, and content format."
-                                elif "SOA" in error_msg:
-                                    error_detail = f"Zone configuration error: {error_msg}. Zone may not be properly initialized."
-                                else:
-                                    error_detail = f"Validation error: {error_msg}"
-                    except:
-                        error_detail += f" - {e.response.text}"
-                        
-                logger.error(f"PowerDNS request failed: {method} {url} - {error_detail}")
-                if data:
-                    logger.error(f"Request data: {data}")
+        client = self._http_client or _get_shared_http_client(self.api_url)
+        return await self._send(client, method, url, data)
+    
+    async def _send(self, client: httpx.AsyncClient, method: str, url: str, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Send one request and translate PowerDNS error responses"""
+        try:
+            response = await client.request(
+                method=method,
+                url=url,
+                headers=self.headers,
+                json=data
+            )
+            response.raise_for_status()
+            return response.json() if response.content else {}
+        except httpx.HTTPStatusError as e:
+            # Log the error details for debugging
+            error_detail = f"PowerDNS API error: {e.response.status_code} {e.response.reason_phrase}"
+            
+            if e.response.content:
+                try:
+                    error_body = e.response.json()
+                    error_detail += f" - {error_body}"
+                    
+                    # For 422 errors, provide more specific guidance
+                    if e.response.status_code == 422:
+                        if "error" in error_body:
+                            error_msg = error_body["error"]
+                            if "RRset" in error_msg or "rrset" in error_msg:
+                                error_detail = f"Record format error: {error_msg}. Check record name, type, and content format."
+                            elif "SOA" in error_msg:
+                                error_detail = f"Zone configuration error: {error_msg}. Zone may not be properly initialized."
+                            else:
+                                error_detail = f"Validation error: {error_msg}"
+                except:
+                    error_detail += f" - {e.response.text}"
                     
-                raise Exception(error_detail) from e
+            logger.error(f"PowerDNS request failed: {method} {url} - {error_detail}")
+            if data:
+                logger.error(f"Request data: {data}")
+                
+            raise Exception(error_detail) from e
     
     async def get_zones(self) -> List[Dict[str, Any]]:
         """Get all zones from PowerDNS"""
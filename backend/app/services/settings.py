@@ -10,6 +10,7 @@ from sqlalchemy.orm import selectinload
 from cryptography.fernet import Fernet
 import os
 import httpx
+from datetime import datetime
 
 from app.models.settings import SystemSettings, PowerDNSSettings, VersioningSettings
 from app.schemas.settings import (
@@ -19,12 +20,28 @@ from app.schemas.settings import (
     PowerDNSSettingUpdate,
     PowerDNSTestResult,
     VersioningSettingsCreate,
-    VersioningSettingsUpdate
+    VersioningSettingsUpdate,
+    PowerDNSHealthSummary,
+    HEALTH_LIST_ADAPTER
 )
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Bumped on every PowerDNS settings change so cached copies can tell they are stale
+_powerdns_settings_revision = 0
+
+
+def powerdns_settings_revision() -> int:
+    """Current revision of the PowerDNS settings table"""
+    return _powerdns_settings_revision
+
+
+def invalidate_powerdns_settings() -> None:
+    """Mark cached PowerDNS settings as stale"""
+    global _powerdns_settings_revision
+    _powerdns_settings_revision += 1
+
 class SettingsService:
     """Service for managing system settings"""
     
@@ -143,6 +160,7 @@ class PowerDNSSettingsService:
         db_setting = PowerDNSSettings(**setting.dict())
         db.add(db_setting)
         await db.commit()
+        invalidate_powerdns_settings()
         await db.refresh(db_setting)
         return db_setting
 
@@ -166,6 +184,7 @@ class PowerDNSSettingsService:
             setattr(db_setting, field, value)
 
         await db.commit()
+        invalidate_powerdns_settings()
         await db.refresh(db_setting)
         return db_setting
 
@@ -177,6 +196,7 @@ class PowerDNSSettingsService:
 
         await db.delete(db_setting)
         await db.commit()
+        invalidate_powerdns_settings()
         return True
 
     async def _unset_all_defaults(self, db: AsyncSession):
@@ -272,9 +292,6 @@ class PowerDNSSettingsService:
 
     async def get_servers_health_status(self, db: AsyncSession, quick_check: bool = True) -> Dict[str, Any]:
         """Get health status of all PowerDNS servers"""
-        from app.schemas.settings import PowerDNSHealthStatus, PowerDNSHealthSummary
-        from datetime import datetime
-        
         servers = await self.get_powerdns_settings(db)
         health_results = []
         
@@ -292,6 +309,7 @@ class PowerDNSSettingsService:
         healthy_count = 0
         unhealthy_count = 0
         unknown_count = 0
+        checked_at = datetime.utcnow()
         
         for i, server in enumerate(servers):
             if i < len(health_data):
@@ -324,27 +342,26 @@ class PowerDNSSettingsService:
                 zones_count = None
                 unknown_count += 1
             
-            health_status = PowerDNSHealthStatus(
-                server_id=server.id,
-                name=server.name,
-                api_url=server.api_url,
-                is_active=server.is_active,
-                health_status=status,
-                last_checked=datetime.utcnow(),
-                response_time_ms=response_time,
-                error_message=error_msg,
-                server_version=server_version,
-                zones_count=zones_count
-            )
-            health_results.append(health_status)
+            health_results.append({
+                "server_id": server.id,
+                "name": server.name,
+                "api_url": server.api_url,
+                "is_active": server.is_active,
+                "health_status": status,
+                "last_checked": checked_at,
+                "response_time_ms": response_time,
+                "error_message": error_msg,
+                "server_version": server_version,
+                "zones_count": zones_count
+            })
         
         return PowerDNSHealthSummary(
             total_servers=len(servers),
             healthy_servers=healthy_count,
             unhealthy_servers=unhealthy_count,
             unknown_servers=unknown_count,
-            last_check_time=datetime.utcnow(),
-            servers=health_results
+            last_check_time=checked_at,
+            servers=HEALTH_LIST_ADAPTER.validate_python(health_results)
         )
 
     async def test_powerdns_connection(
@@ -1,6 +1,5 @@
 """API Token authentication service"""
 
-import hashlib
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
@@ -27,7 +26,10 @@ async def verify_api_token(
         return None
     
     # Hash the token
-    token_hash = hashlib.sha256(token.encode()).hexdigest()
+    try:
+        token_hash = APIToken.hash_token(token)
+    except UnicodeEncodeError:
+        return None
     
     # Find token in database
     result = await session.execute(
@@ -1,6 +1,6 @@
 """Zone versioning service"""
 
-import json
+import logging
 from typing import List, Dict, Any, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, desc
@@ -11,6 +11,8 @@ from app.models.user import User, ZoneVersion
 from app.models.dns import Zone, Record
 from app.services.powerdns import PowerDNSClient
 
+logger = logging.getLogger(__name__)
+
 
 class ZoneVersioningService:
     """Service for managing zone versions and rollbacks"""
@@ -359,7 +361,5 @@ class ZoneVersioningService:
             
         except Exception as e:
             # Log the error but don't fail the main operation
-            import logging
-            logger = logging.getLogger(__name__)
             logger.warning(f"Failed to auto-create version for zone {zone_name}: {e}")
             return None
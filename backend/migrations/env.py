@@ -9,7 +9,7 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from app.core.database import Base
-from app.models import user, dns, audit  # Import all model modules
+from app.models import user, dns, settings as settings_models, audit  # Import all model modules
 from app.core.config import settings
 
 # this is the Alembic Config object, which provides
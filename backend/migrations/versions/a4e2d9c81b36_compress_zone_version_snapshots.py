@@ -0,0 +1,86 @@
+"""Store zone version snapshots as compressed binary
+
+Revision ID: a4e2d9c81b36
+Revises: f1c9a27d5b84
+Create Date: 2025-08-12 15:00:00.000000
+
+"""
+from alembic import op
+import orjson
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.core.database import compress_json, decompress_json
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4e2d9c81b36'
+down_revision = 'f1c9a27d5b84'
+branch_labels = None
+depends_on = None
+
+SNAPSHOT_COLUMNS = ['zone_data', 'records_data']
+
+# Snapshots can be megabytes each; rewrite them a bounded number of rows at a time
+BATCH_SIZE = 100
+
+
+def _json_type(dialect_name: str):
+    return postgresql.JSONB() if dialect_name == 'postgresql' else sa.JSON()
+
+
+def _convert(source_type, target_type, transform) -> None:
+    """Rewrite every snapshot column into a temporary column of the new type and swap it in"""
+    bind = op.get_bind()
+
+    with op.batch_alter_table('zone_versions') as batch_op:
+        for column in SNAPSHOT_COLUMNS:
+            batch_op.add_column(sa.Column(f'{column}_new', target_type, nullable=True))
+
+    source = sa.table('zone_versions', sa.column('id'), *(sa.column(c, source_type) for c in SNAPSHOT_COLUMNS))
+    target = sa.table('zone_versions', sa.column('id'), *(sa.column(f'{c}_new', target_type) for c in SNAPSHOT_COLUMNS))
+    update = (
+        target.update()
+        .where(target.c.id == sa.bindparam('b_id'))
+        .values({f'{c}_new': sa.bindparam(f'b_{c}') for c in SNAPSHOT_COLUMNS})
+    )
+
+    # Keyset pagination on id: only one batch is held in memory, and no cursor
+    # stays open on the table while it is being updated
+    last_id = None
+    while True:
+        query = sa.select(source).order_by(source.c.id).limit(BATCH_SIZE)
+        if last_id is not None:
+            query = query.where(source.c.id > last_id)
+        rows = bind.execute(query).mappings().all()
+        if not rows:
+            break
+        bind.execute(update, [
+            {'b_id': row['id'], **{f'b_{c}': transform(row[c]) for c in SNAPSHOT_COLUMNS}}
+            for row in rows
+        ])
+        last_id = rows[-1]['id']
+
+    with op.batch_alter_table('zone_versions') as batch_op:
+        for column in SNAPSHOT_COLUMNS:
+            batch_op.drop_column(column)
+            batch_op.alter_column(f'{column}_new', new_column_name=column, nullable=False)
+
+
+def _load(value):
+    # Drivers without a JSON type adapter hand the raw text back
+    return orjson.loads(value) if isinstance(value, (str, bytes)) else value
+
+
+def upgrade() -> None:
+    dialect_name = op.get_bind().dialect.name
+    _convert(_json_type(dialect_name), sa.LargeBinary(), lambda value: compress_json(_load(value)))
+
+    if dialect_name == 'postgresql':
+        # Payloads are already compressed; skip TOAST's second compression pass
+        for column in SNAPSHOT_COLUMNS:
+            op.execute(f'ALTER TABLE zone_versions ALTER COLUMN {column} SET STORAGE EXTERNAL')
+
+
+def downgrade() -> None:
+    _convert(sa.LargeBinary(), _json_type(op.get_bind().dialect.name), decompress_json)
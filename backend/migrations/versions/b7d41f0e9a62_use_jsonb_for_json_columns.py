@@ -0,0 +1,49 @@
+"""Use JSONB for JSON document columns on PostgreSQL
+
+Revision ID: b7d41f0e9a62
+Revises: c3caea0975e2
+Create Date: 2025-08-10 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d41f0e9a62'
+down_revision = 'c3caea0975e2'
+branch_labels = None
+depends_on = None
+
+# (table, column) pairs stored as JSONDocument
+JSON_COLUMNS = [
+    ('audit_logs', 'details'),
+    ('zone_versions', 'zone_data'),
+    ('zone_versions', 'records_data'),
+]
+
+
+def upgrade() -> None:
+    # SQLite has no JSONB; the generic JSON columns stay as they are there
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=postgresql.JSONB(),
+            postgresql_using=f'{column}::jsonb'
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.JSON(),
+            postgresql_using=f'{column}::json'
+        )
@@ -0,0 +1,53 @@
+"""Add composite indexes to audit_logs
+
+Revision ID: d52e8c1a7f03
+Revises: b7d41f0e9a62
+Create Date: 2025-08-11 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd52e8c1a7f03'
+down_revision = 'b7d41f0e9a62'
+branch_labels = None
+depends_on = None
+
+# (name, columns) of the composite indexes
+COMPOSITE_INDEXES = [
+    ('ix_audit_resource_created', ['resource_type', 'resource_id', 'created_at']),
+    ('ix_audit_user_created', ['user_id', 'created_at']),
+    ('ix_audit_eventtype_created', ['event_type', 'created_at']),
+]
+
+# Single-column indexes that are now leading prefixes of a composite index
+REDUNDANT_INDEXES = [
+    ('ix_audit_logs_resource_type', ['resource_type']),
+    ('ix_audit_logs_user_id', ['user_id']),
+    ('ix_audit_logs_event_type', ['event_type']),
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+        with op.get_context().autocommit_block():
+            for name, columns in COMPOSITE_INDEXES:
+                op.create_index(name, 'audit_logs', columns, unique=False, postgresql_concurrently=True)
+            for name, _ in REDUNDANT_INDEXES:
+                op.drop_index(name, table_name='audit_logs', postgresql_concurrently=True)
+        return
+    
+    for name, columns in COMPOSITE_INDEXES:
+        op.create_index(name, 'audit_logs', columns, unique=False)
+    for name, _ in REDUNDANT_INDEXES:
+        op.drop_index(name, table_name='audit_logs')
+
+
+def downgrade() -> None:
+    for name, columns in REDUNDANT_INDEXES:
+        op.create_index(name, 'audit_logs', columns, unique=False)
+    for name, _ in COMPOSITE_INDEXES:
+        op.drop_index(name, table_name='audit_logs')
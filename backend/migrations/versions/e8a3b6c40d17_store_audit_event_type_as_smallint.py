@@ -0,0 +1,92 @@
+"""Store audit_logs.event_type as SMALLINT codes
+
+Revision ID: e8a3b6c40d17
+Revises: d52e8c1a7f03
+Create Date: 2025-08-11 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8a3b6c40d17'
+down_revision = 'd52e8c1a7f03'
+branch_labels = None
+depends_on = None
+
+# Must match AUDIT_EVENT_CODES in app/models/audit.py
+EVENT_CODES = [
+    ('LOGIN_SUCCESS', 1),
+    ('LOGIN_FAILED', 2),
+    ('LOGOUT', 3),
+    ('PASSWORD_CHANGE', 4),
+    ('PASSWORD_RESET_REQUEST', 5),
+    ('PASSWORD_RESET_SUCCESS', 6),
+    ('USER_CREATED', 7),
+    ('USER_UPDATED', 8),
+    ('USER_DELETED', 9),
+    ('USER_ROLE_CHANGED', 10),
+    ('USER_PERMISSION_GRANTED', 11),
+    ('USER_PERMISSION_REVOKED', 12),
+    ('ZONE_CREATED', 13),
+    ('ZONE_UPDATED', 14),
+    ('ZONE_DELETED', 15),
+    ('RECORD_CREATED', 16),
+    ('RECORD_UPDATED', 17),
+    ('RECORD_DELETED', 18),
+    ('API_TOKEN_CREATED', 19),
+    ('API_TOKEN_USED', 20),
+    ('API_TOKEN_DELETED', 21),
+    ('API_TOKEN_DEACTIVATED', 22),
+    ('UNAUTHORIZED_ACCESS', 23),
+    ('RATE_LIMIT_EXCEEDED', 24),
+    ('SUSPICIOUS_ACTIVITY', 25),
+    ('BACKUP_CREATED', 26),
+    ('BACKUP_RESTORED', 27),
+    ('VERSION_CREATED', 28),
+    ('VERSION_ROLLBACK', 29),
+]
+
+
+def _name_to_code(column: str) -> str:
+    whens = " ".join(f"WHEN '{name}' THEN {code}" for name, code in EVENT_CODES)
+    return f"CASE {column} {whens} END"
+
+
+def _code_to_name(column: str) -> str:
+    whens = " ".join(f"WHEN {code} THEN '{name}'" for name, code in EVENT_CODES)
+    return f"CASE {column} {whens} END"
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.alter_column(
+            'audit_logs', 'event_type',
+            type_=sa.SmallInteger(),
+            postgresql_using=_name_to_code('event_type::text')
+        )
+        op.execute("DROP TYPE IF EXISTS auditeventtype")
+        return
+    
+    op.execute(f"UPDATE audit_logs SET event_type = {_name_to_code('event_type')}")
+    with op.batch_alter_table('audit_logs') as batch_op:
+        batch_op.alter_column('event_type', type_=sa.SmallInteger(), existing_nullable=False)
+
+
+def downgrade() -> None:
+    event_type = postgresql.ENUM(*[name for name, _ in EVENT_CODES], name='auditeventtype')
+    
+    if op.get_bind().dialect.name == 'postgresql':
+        event_type.create(op.get_bind(), checkfirst=True)
+        op.alter_column(
+            'audit_logs', 'event_type',
+            type_=event_type,
+            postgresql_using=f"({_code_to_name('event_type')})::auditeventtype"
+        )
+        return
+    
+    with op.batch_alter_table('audit_logs') as batch_op:
+        batch_op.alter_column('event_type', type_=sa.String(length=23), existing_nullable=False)
+    op.execute(f"UPDATE audit_logs SET event_type = {_code_to_name('event_type')}")
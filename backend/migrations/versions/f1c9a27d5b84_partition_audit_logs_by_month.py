@@ -0,0 +1,97 @@
+"""Partition audit_logs by month on created_at
+
+Revision ID: f1c9a27d5b84
+Revises: e8a3b6c40d17
+Create Date: 2025-08-12 10:00:00.000000
+
+"""
+from datetime import date, datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1c9a27d5b84'
+down_revision = 'e8a3b6c40d17'
+branch_labels = None
+depends_on = None
+
+# Partitions created ahead of the current month
+MONTHS_AHEAD = 2
+
+# Secondary indexes, recreated on the partitioned parent so every partition inherits them
+INDEXES = [
+    ('ix_audit_logs_id', ['id']),
+    ('ix_audit_logs_created_at', ['created_at']),
+    ('ix_audit_logs_resource_id', ['resource_id']),
+    ('ix_audit_logs_success', ['success']),
+    ('ix_audit_resource_created', ['resource_type', 'resource_id', 'created_at']),
+    ('ix_audit_user_created', ['user_id', 'created_at']),
+    ('ix_audit_eventtype_created', ['event_type', 'created_at']),
+]
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _create_month_partition(month: date) -> None:
+    op.execute(
+        f"CREATE TABLE audit_logs_{month:%Y_%m} PARTITION OF audit_logs "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_next_month(month).isoformat()}')"
+    )
+
+
+def upgrade() -> None:
+    # Declarative partitioning is PostgreSQL only; SQLite keeps the plain table
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_unpartitioned")
+    op.execute(
+        "CREATE TABLE audit_logs (LIKE audit_logs_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+        "PARTITION BY RANGE (created_at)"
+    )
+    # Keep the id sequence alive when the old table is dropped
+    op.execute("ALTER SEQUENCE audit_logs_id_seq OWNED BY audit_logs.id")
+
+    # One partition per month from the oldest existing row through MONTHS_AHEAD
+    oldest = bind.execute(sa.text("SELECT min(created_at) FROM audit_logs_unpartitioned")).scalar()
+    today = datetime.now(timezone.utc).date()
+    month = date((oldest or today).year, (oldest or today).month, 1)
+    last = date(today.year, today.month, 1)
+    for _ in range(MONTHS_AHEAD):
+        last = _next_month(last)
+    while month <= last:
+        _create_month_partition(month)
+        month = _next_month(month)
+    # Catch-all so inserts never fail if a monthly partition is missing
+    op.execute("CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT")
+
+    op.execute("INSERT INTO audit_logs SELECT * FROM audit_logs_unpartitioned")
+    op.execute("DROP TABLE audit_logs_unpartitioned")
+
+    # Unique constraints on a partitioned table must include the partition key
+    op.create_primary_key('audit_logs_pkey', 'audit_logs', ['id', 'created_at'])
+    op.create_foreign_key('audit_logs_user_id_fkey', 'audit_logs', 'users', ['user_id'], ['id'])
+    for name, columns in INDEXES:
+        op.create_index(name, 'audit_logs', columns, unique=False)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_partitioned")
+    op.execute("CREATE TABLE audit_logs (LIKE audit_logs_partitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+    op.execute("ALTER SEQUENCE audit_logs_id_seq OWNED BY audit_logs.id")
+    op.execute("INSERT INTO audit_logs SELECT * FROM audit_logs_partitioned")
+    # Dropping the parent drops every partition with it
+    op.execute("DROP TABLE audit_logs_partitioned")
+
+    op.create_primary_key('audit_logs_pkey', 'audit_logs', ['id'])
+    op.create_foreign_key('audit_logs_user_id_fkey', 'audit_logs', 'users', ['user_id'], ['id'])
+    for name, columns in INDEXES:
+        op.create_index(name, 'audit_logs', columns, unique=False)
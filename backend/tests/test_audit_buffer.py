@@ -0,0 +1,163 @@
+"""Test the background audit log buffer"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from app.models import audit
+from app.models.audit import AuditEventType, AuditLogBuffer, AuditService
+
+
+class FakeSession:
+    """Records the rows passed to execute(); fails while fail_when(rows) is true"""
+
+    def __init__(self, writes, fail_when=None):
+        self.writes = writes
+        self.fail_when = fail_when
+        self.bind = SimpleNamespace(dialect=SimpleNamespace(name="sqlite"))
+        self._rows = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement, rows=None):
+        if self.fail_when and self.fail_when(rows):
+            raise RuntimeError("write failed")
+        self._rows = rows
+
+    async def commit(self):
+        self.writes.append(self._rows)
+
+
+def make_buffer(fail_when=None, **kwargs):
+    writes = []
+    buffer = AuditLogBuffer(session_factory=lambda: FakeSession(writes, fail_when), **kwargs)
+    return buffer, writes
+
+
+EPOCH = datetime(2025, 8, 12, tzinfo=timezone.utc)
+
+
+def make_row(n):
+    return {
+        "event_type": AuditEventType.LOGIN_SUCCESS,
+        "event_description": f"event {n}",
+        "created_at": EPOCH + timedelta(seconds=n),
+    }
+
+
+class TestAuditLogBuffer:
+    """Test batching, flush timing and shutdown of the audit buffer"""
+
+    async def test_rows_are_written_in_one_batch(self):
+        buffer, writes = make_buffer(max_delay=0.05)
+        buffer.start()
+        for n in range(5):
+            assert buffer.put(make_row(n))
+        await asyncio.sleep(0.2)
+        await buffer.stop()
+
+        assert len(writes) == 1
+        assert [row["event_description"] for row in writes[0]] == [f"event {n}" for n in range(5)]
+        # The flush keeps each row's own event time
+        assert [row["created_at"] for row in writes[0]] == [EPOCH + timedelta(seconds=n) for n in range(5)]
+
+    async def test_batches_are_capped_at_max_batch(self):
+        buffer, writes = make_buffer(max_batch=3, max_delay=0.05)
+        buffer.start()
+        for n in range(7):
+            buffer.put(make_row(n))
+        await asyncio.sleep(0.2)
+        await buffer.stop()
+
+        assert [len(batch) for batch in writes] == [3, 3, 1]
+
+    async def test_max_delay_cuts_off_a_batch(self):
+        buffer, writes = make_buffer(max_delay=0.05)
+        buffer.start()
+        buffer.put(make_row(0))
+        await asyncio.sleep(0.15)
+        assert [len(batch) for batch in writes] == [1]
+
+        buffer.put(make_row(1))
+        await asyncio.sleep(0.15)
+        await buffer.stop()
+
+        assert [len(batch) for batch in writes] == [1, 1]
+
+    async def test_stop_drains_collected_and_queued_rows(self):
+        buffer, writes = make_buffer(max_batch=2, max_delay=10)
+        buffer.start()
+        for n in range(5):
+            buffer.put(make_row(n))
+        # Let the task pick up the first batch and start collecting the next
+        await asyncio.sleep(0.05)
+        await buffer.stop()
+
+        written = [row["event_description"] for batch in writes for row in batch]
+        assert written == [f"event {n}" for n in range(5)]
+        assert not buffer.running
+
+    async def test_failed_batch_is_retried_row_by_row(self, caplog):
+        bad = make_row(1)
+        buffer, writes = make_buffer(fail_when=lambda rows: any(row is bad for row in rows))
+
+        await buffer._flush([make_row(0), bad, make_row(2)])
+
+        assert [[row["event_description"] for row in batch] for batch in writes] == [["event 0"], ["event 2"]]
+        assert "Dropped audit log entry" in caplog.text
+        assert "event 1" in caplog.text
+
+    def test_put_fails_when_not_running(self):
+        buffer, _ = make_buffer()
+        assert buffer.put(make_row(0)) is False
+
+    async def test_put_fails_when_full(self):
+        buffer, _ = make_buffer(max_queue=1, max_delay=10)
+        buffer.start()
+        # No await in between, so the task has not taken anything off the queue yet
+        assert buffer.put(make_row(0)) is True
+        assert buffer.put(make_row(1)) is False
+        await buffer.stop()
+
+
+class TestAuditServiceFallback:
+    """Test that log_event writes on the caller's session when the buffer is unavailable"""
+
+    async def test_log_event_falls_back_to_session(self, monkeypatch):
+        buffer, writes = make_buffer()
+        monkeypatch.setattr(audit, "audit_log_buffer", buffer)
+
+        executed = []
+
+        class Session:
+            async def execute(self, statement):
+                executed.append(statement)
+
+        await AuditService(Session()).log_event(AuditEventType.LOGOUT, "logged out", user_email="a@example.com")
+
+        assert len(executed) == 1
+        params = executed[0].compile().params
+        assert params["event_description"] == "logged out"
+        assert params["user_email"] == "a@example.com"
+        assert writes == []
+
+
+class TestAuditEventTime:
+    """Test that entries carry the time of the event, not of the flush"""
+
+    async def test_log_event_stamps_the_call_time(self, monkeypatch):
+        buffer, writes = make_buffer(max_delay=0.05)
+        monkeypatch.setattr(audit, "audit_log_buffer", buffer)
+        buffer.start()
+
+        before = datetime.now(timezone.utc)
+        await AuditService(None).log_event(AuditEventType.LOGOUT, "logged out")
+        after = datetime.now(timezone.utc)
+        await asyncio.sleep(0.15)
+        await buffer.stop()
+
+        assert before <= writes[0][0]["created_at"] <= after
@@ -0,0 +1,32 @@
+"""Test that the audit event SMALLINT codes stay in sync"""
+
+import ast
+from pathlib import Path
+
+from app.models.audit import AUDIT_EVENT_BY_CODE, AUDIT_EVENT_CODES, AuditEventType
+
+MIGRATION = Path(__file__).parent.parent / "migrations" / "versions" / "e8a3b6c40d17_store_audit_event_type_as_smallint.py"
+
+
+def migration_event_codes():
+    """EVENT_CODES from the migration, read without importing alembic"""
+    tree = ast.parse(MIGRATION.read_text())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == "EVENT_CODES" for t in node.targets):
+            return dict(ast.literal_eval(node.value))
+    raise AssertionError("EVENT_CODES not found in migration")
+
+
+class TestAuditEventCodes:
+    """Test the model and migration code tables against each other"""
+
+    def test_every_event_type_has_a_code(self):
+        assert set(AUDIT_EVENT_CODES) == set(AuditEventType)
+
+    def test_codes_are_unique(self):
+        assert len(AUDIT_EVENT_BY_CODE) == len(AUDIT_EVENT_CODES)
+
+    def test_migration_matches_model(self):
+        model_codes = {event.name: code for event, code in AUDIT_EVENT_CODES.items()}
+
+        assert migration_event_codes() == model_codes
@@ -0,0 +1,52 @@
+"""Test compressed JSON storage of zone version snapshots"""
+
+import zlib
+
+import pytest
+
+from app.core import database
+from app.core.database import CompressedJSON, compress_json, decompress_json
+
+SNAPSHOT = {
+    "zone": {"name": "example.com.", "kind": "Native", "serial": 2025081201},
+    "records": [{"name": f"host{n}.example.com.", "type": "A", "content": f"192.0.2.{n}"} for n in range(50)],
+}
+
+
+class TestCompressedJSON:
+    """Test the compress_json / decompress_json round trip for both codecs"""
+
+    def test_zstd_round_trip(self):
+        pytest.importorskip("zstandard")
+        blob = compress_json(SNAPSHOT)
+
+        assert blob[:4] == database._ZSTD_MAGIC
+        assert decompress_json(blob) == SNAPSHOT
+
+    def test_zlib_fallback_round_trip(self, monkeypatch):
+        monkeypatch.setattr(database, "_zstd_compressor", None)
+        blob = compress_json(SNAPSHOT)
+
+        assert blob[:4] != database._ZSTD_MAGIC
+        assert zlib.decompress(blob)
+        assert decompress_json(blob) == SNAPSHOT
+
+    def test_zlib_blobs_still_read_with_zstd_installed(self):
+        pytest.importorskip("zstandard")
+        blob = zlib.compress(b'{"name":"example.com."}')
+
+        assert decompress_json(blob) == {"name": "example.com."}
+
+    def test_type_decorator_round_trip(self):
+        column_type = CompressedJSON()
+        blob = column_type.process_bind_param(SNAPSHOT, dialect=None)
+
+        assert isinstance(blob, bytes)
+        assert len(blob) < len(str(SNAPSHOT))
+        assert column_type.process_result_value(blob, dialect=None) == SNAPSHOT
+
+    def test_type_decorator_passes_none_through(self):
+        column_type = CompressedJSON()
+
+        assert column_type.process_bind_param(None, dialect=None) is None
+        assert column_type.process_result_value(None, dialect=None) is None
@@ -0,0 +1,57 @@
+"""Test request metrics grouping"""
+
+from app.middleware.monitoring import RequestMetrics, _endpoint_id, _endpoint_patterns
+
+
+class TestEndpointGrouping:
+    """Test the fused prefix regex behind _endpoint_id"""
+
+    def test_paths_under_a_prefix_share_one_pattern(self):
+        zone_a = _endpoint_id("/api/zones/example.com")
+        zone_b = _endpoint_id("/api/zones/example.org")
+
+        assert zone_a == zone_b
+        assert _endpoint_patterns[zone_a] == "/api/zones/{zone_name}"
+
+    def test_each_prefix_maps_to_its_own_pattern(self):
+        expected = {
+            "/api/zones/example.com": "/api/zones/{zone_name}",
+            "/api/records/example.com": "/api/records/{zone_name}",
+            "/api/users/7": "/api/users/{user_id}",
+            "/api/tokens/3": "/api/tokens/{token_id}",
+            "/api/settings/powerdns/2/health": "/api/settings/powerdns/{setting_id}",
+        }
+
+        assert {path: _endpoint_patterns[_endpoint_id(path)] for path in expected} == expected
+
+    def test_unmatched_paths_are_their_own_pattern(self):
+        for path in ("/api/zones", "/api/settings/versioning", "/auth/jwt/login"):
+            assert _endpoint_patterns[_endpoint_id(path)] == path
+
+    def test_ids_are_stable(self):
+        first = _endpoint_id("/api/users/1")
+        _endpoint_id.cache_clear()
+
+        assert _endpoint_id("/api/users/2") == first
+
+
+class TestRequestMetricsAggregator:
+    """Test the lifecycle of the background aggregation task"""
+
+    async def test_stop_cancels_the_aggregator(self):
+        metrics = RequestMetrics(aggregate_interval=60)
+        metrics.start_aggregator()
+        task = metrics._aggregator_task
+
+        await metrics.stop_aggregator()
+
+        assert task.cancelled()
+        assert metrics._aggregator_task is None
+
+    def test_summary_aggregates_on_demand_without_the_task(self):
+        metrics = RequestMetrics()
+        metrics.record_request(_endpoint_id("/api/zones/example.com"), "GET", 200, 2_000_000)
+
+        summary = metrics.get_summary()
+
+        assert summary["endpoints"]["GET /api/zones/{zone_name}"]["count"] == 1
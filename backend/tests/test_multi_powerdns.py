@@ -0,0 +1,310 @@
+"""Test multi-server PowerDNS dispatch"""
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from app.services.multi_powerdns import CircuitState, MultiPowerDNSService, _is_server_failure
+from app.services.settings import invalidate_powerdns_settings
+
+
+def make_server(server_id, is_default=False, multi_server_mode=True, is_active=True):
+    return SimpleNamespace(
+        id=server_id,
+        name=f"ns{server_id}",
+        api_url=f"http://ns{server_id}:8081",
+        api_key="secret",
+        timeout=30,
+        verify_ssl=True,
+        is_default=is_default,
+        multi_server_mode=multi_server_mode,
+        is_active=is_active,
+    )
+
+
+class FakeSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeClient:
+    """Stands in for PowerDNSClient; fails every call with error when one is set"""
+
+    def __init__(self, error=None, delay=0.0):
+        self.error = error
+        self.delay = delay
+        self.calls = []
+
+    async def delete_zone(self, zone_name):
+        self.calls.append(zone_name)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return {"deleted": zone_name}
+
+    async def create_record(self, zone_name, record):
+        self.calls.append(record.name)
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        if record.content == "invalid":
+            raise Exception("Record format error") from status_error(422)
+        return {}
+
+
+def status_error(status_code):
+    request = httpx.Request("PATCH", "http://ns:8081/api/v1/servers/localhost/zones/example.com.")
+    return httpx.HTTPStatusError("error", request=request, response=httpx.Response(status_code, request=request))
+
+
+@pytest.fixture
+def make_service(monkeypatch):
+    """Build a service whose settings and clients come from the given servers"""
+
+    def build(servers, clients=None, **kwargs):
+        service = MultiPowerDNSService(session_factory=FakeSession, **kwargs)
+        service.settings_loads = 0
+        clients = clients if clients is not None else {server.id: FakeClient() for server in servers}
+
+        async def get_powerdns_settings(db):
+            service.settings_loads += 1
+            return servers
+
+        async def get_client(server):
+            return clients[server.id]
+
+        monkeypatch.setattr(service.settings_service, "get_powerdns_settings", get_powerdns_settings)
+        monkeypatch.setattr(service, "_get_client", get_client)
+        return service, clients
+
+    return build
+
+
+class TestDispatch:
+    """Test the choice between the default server and the fan-out"""
+
+    async def test_single_server_mode_uses_only_the_default_server(self, make_service):
+        servers = [make_server(1), make_server(2, is_default=True, multi_server_mode=False)]
+        service, clients = make_service(servers)
+
+        result = await service.delete_zone_from_all(None, "example.com")
+
+        assert result.is_complete_success
+        assert [r.server_name for r in result.results] == ["ns2"]
+        assert clients[1].calls == []
+
+    async def test_single_server_mode_never_opens_a_circuit_breaker(self, make_service):
+        servers = [make_server(1, is_default=True, multi_server_mode=False)]
+        service, clients = make_service(servers, {1: FakeClient(error=Exception("PowerDNS API error: 422"))})
+
+        for _ in range(10):
+            result = await service.delete_zone_from_all(None, "example.com")
+            assert result.results[0].error == "PowerDNS API error: 422"
+
+        assert len(clients[1].calls) == 10
+        assert service._get_circuit_breaker(1).failure_count == 0
+
+    async def test_no_default_server(self, make_service):
+        service, _ = make_service([])
+
+        result = await service.delete_zone_from_all(None, "example.com")
+
+        assert result.is_complete_failure
+        assert result.results[0].error == "No default PowerDNS server configured"
+
+    async def test_multi_server_mode_fans_out_to_every_healthy_server(self, make_service):
+        servers = [make_server(1, is_default=True), make_server(2), make_server(3), make_server(4, is_active=False)]
+        service, clients = make_service(servers)
+        breaker = service._get_circuit_breaker(3)
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+
+        result = await service.delete_zone_from_all(None, "example.com")
+
+        assert breaker.state == CircuitState.OPEN
+        assert sorted(r.server_name for r in result.results) == ["ns1", "ns2"]
+        assert result.is_complete_success
+        assert clients[3].calls == [] and clients[4].calls == []
+
+    async def test_fan_out_respects_the_concurrency_cap(self, make_service):
+        servers = [make_server(n, is_default=n == 1) for n in range(1, 7)]
+        service, clients = make_service(
+            servers, {server.id: FakeClient(delay=0.02) for server in servers}, max_concurrency=2
+        )
+        in_flight = peak = 0
+        original = FakeClient.delete_zone
+
+        async def counting_delete_zone(self, zone_name):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                return await original(self, zone_name)
+            finally:
+                in_flight -= 1
+
+        for client in clients.values():
+            client.delete_zone = counting_delete_zone.__get__(client)
+
+        result = await service.delete_zone_from_all(None, "example.com")
+
+        assert result.success_count == 6
+        assert peak == 2
+
+
+class TestSettingsSnapshot:
+    """Test when the cached settings snapshot is reused and when it is reloaded"""
+
+    async def test_snapshot_is_reused_within_the_ttl(self, make_service):
+        service, _ = make_service([make_server(1, is_default=True, multi_server_mode=False)])
+
+        for _ in range(3):
+            await service.delete_zone_from_all(None, "example.com")
+
+        assert service.settings_loads == 1
+
+    async def test_settings_change_forces_a_reload(self, make_service):
+        service, _ = make_service([make_server(1, is_default=True, multi_server_mode=False)])
+        await service.delete_zone_from_all(None, "example.com")
+
+        invalidate_powerdns_settings()
+        await service.delete_zone_from_all(None, "example.com")
+
+        assert service.settings_loads == 2
+
+    async def test_expired_snapshot_is_reloaded(self, make_service):
+        service, _ = make_service([make_server(1, is_default=True)])
+        await service._get_settings_snapshot()
+
+        await service._get_settings_snapshot(ttl=0)
+
+        assert service.settings_loads == 2
+
+    async def test_concurrent_misses_share_one_load(self, make_service):
+        service, _ = make_service([make_server(1, is_default=True)])
+
+        await asyncio.gather(*[service._get_settings_snapshot() for _ in range(5)])
+
+        assert service.settings_loads == 1
+
+    async def test_default_server_falls_back_to_the_lowest_id(self, make_service):
+        service, _ = make_service([make_server(3), make_server(2)])
+
+        snapshot = await service._get_settings_snapshot()
+
+        assert snapshot.default_server.id == 2
+        assert snapshot.multi_enabled
+
+
+def record_rows(*contents):
+    return [("example.com", {"name": f"host{n}", "type": "A", "content": content}) for n, content in enumerate(contents)]
+
+
+class TestBulkAdd:
+    """Test add_records_to_all with mixed valid and invalid records"""
+
+    async def test_invalid_records_do_not_fail_valid_ones(self, make_service):
+        servers = [make_server(1, is_default=True), make_server(2)]
+        service, _ = make_service(servers, max_concurrency=2)
+        rows = record_rows(*["invalid"] * 10, *["192.0.2.1"] * 5)
+
+        results = await service.add_records_to_all(None, rows)
+
+        assert [r.success_count for r in results] == [0] * 10 + [2] * 5
+        assert all("Record format error" in r.results[0].error for r in results[:10])
+        assert all(service._get_circuit_breaker(s.id).state == CircuitState.CLOSED for s in servers)
+
+    async def test_unreachable_server_opens_its_breaker(self, make_service):
+        servers = [make_server(1, is_default=True), make_server(2)]
+        request = httpx.Request("PATCH", "http://ns2:8081")
+        clients = {1: FakeClient(), 2: FakeClient(error=httpx.ConnectError("refused", request=request))}
+        service, _ = make_service(servers, clients, max_concurrency=1)
+
+        results = await service.add_records_to_all(None, record_rows(*["192.0.2.1"] * 8))
+
+        assert all(r.success_count == 1 for r in results)
+        assert service._get_circuit_breaker(2).state == CircuitState.OPEN
+        # Five connection failures open the breaker; the remaining calls are refused without a request
+        assert len(clients[2].calls) == 5
+        assert "Circuit breaker open" in results[-1].results[-1].error
+
+    def test_only_server_faults_count_as_failures(self):
+        errors = {
+            "timeout": TimeoutError(),
+            "connect": httpx.ConnectError("refused"),
+            "500": Exception("PowerDNS API error: 500"),
+            "422": Exception("PowerDNS API error: 422"),
+            "validation": ValueError("Invalid IPv4 address"),
+        }
+        errors["500"].__cause__ = status_error(500)
+        errors["422"].__cause__ = status_error(422)
+
+        assert {name: _is_server_failure(e) for name, e in errors.items()} == {
+            "timeout": True, "connect": True, "500": True, "422": False, "validation": False
+        }
+
+
+class TestClientPool:
+    """Test reuse and replacement of pooled PowerDNS clients"""
+
+    async def test_client_is_reused_until_its_settings_change(self):
+        service = MultiPowerDNSService()
+        server = make_server(1)
+
+        first = await service._get_client(server)
+        assert await service._get_client(server) is first
+
+        server.verify_ssl = False
+        replaced = await service._get_client(server)
+        assert replaced is not first
+
+        server.timeout = 5
+        assert await service._get_client(server) is not replaced
+        await service.close()
+
+    async def test_replaced_client_is_closed_after_the_grace_period(self):
+        service = MultiPowerDNSService()
+        service.client_retire_grace = 0.01
+        server = make_server(1)
+        old = await service._get_client(server)
+
+        server.api_key = "rotated"
+        new = await service._get_client(server)
+        # Calls already running on the old client are not cut off
+        assert old._http_client is not None
+
+        await asyncio.sleep(0.05)
+        assert old._http_client is None
+        assert new._http_client is not None
+        await service.close()
+
+    async def test_concurrent_replacement_builds_one_client(self):
+        service = MultiPowerDNSService()
+        server = make_server(1)
+        await service._get_client(server)
+
+        server.timeout = 5
+        clients = await asyncio.gather(*[service._get_client(server) for _ in range(5)])
+
+        assert len({id(client) for client in clients}) == 1
+        assert len(service._retiring) == 1
+        await service.close()
+
+    async def test_close_closes_retiring_clients_immediately(self):
+        service = MultiPowerDNSService()
+        server = make_server(1)
+        old = await service._get_client(server)
+        server.timeout = 5
+        new = await service._get_client(server)
+
+        await service.close()
+
+        assert old._http_client is None
+        assert new._http_client is None
+        assert not service._retiring
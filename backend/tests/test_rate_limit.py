@@ -0,0 +1,108 @@
+"""Test the in-memory rate limiter"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.middleware import rate_limit
+from app.middleware.rate_limit import InMemoryRateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for time.time() inside the rate limiter"""
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(rate_limit, "time", SimpleNamespace(time=lambda: now.value))
+    return now
+
+
+class TestInMemoryRateLimiter:
+    """Test the per-second bucket window"""
+
+    async def test_requests_over_the_limit_are_rejected(self, clock):
+        limiter = InMemoryRateLimiter()
+
+        for expected_remaining in (2, 1, 0):
+            allowed, info = await limiter.is_allowed("ip:/path", limit=3, window=10)
+            assert allowed
+            assert info["remaining"] == expected_remaining
+
+        allowed, info = await limiter.is_allowed("ip:/path", limit=3, window=10)
+        assert not allowed
+        assert info["current"] == 3
+
+    async def test_window_rolls_over_after_a_full_window(self, clock):
+        limiter = InMemoryRateLimiter()
+        for _ in range(3):
+            await limiter.is_allowed("ip:/path", limit=3, window=10)
+
+        clock.value += 9.5
+        allowed, _ = await limiter.is_allowed("ip:/path", limit=3, window=10)
+        assert not allowed
+
+        # elapsed >= window clears every bucket at once
+        clock.value = 1010.0
+        allowed, info = await limiter.is_allowed("ip:/path", limit=3, window=10)
+        assert allowed
+        assert info["current"] == 1
+
+    async def test_partial_slide_drops_only_expired_seconds(self, clock):
+        limiter = InMemoryRateLimiter()
+        await limiter.is_allowed("ip:/path", limit=3, window=10)
+        await limiter.is_allowed("ip:/path", limit=3, window=10)
+
+        clock.value = 1005.0
+        allowed, info = await limiter.is_allowed("ip:/path", limit=3, window=10)
+        assert allowed
+        assert info["current"] == 3
+
+        # Second 1000 has left the window, second 1005 is still in it
+        clock.value = 1010.0
+        allowed, info = await limiter.is_allowed("ip:/path", limit=3, window=10)
+        assert allowed
+        assert info["current"] == 2
+
+        allowed, _ = await limiter.is_allowed("ip:/path", limit=3, window=10)
+        assert allowed
+        allowed, _ = await limiter.is_allowed("ip:/path", limit=3, window=10)
+        assert not allowed
+
+    async def test_keys_are_counted_separately(self, clock):
+        limiter = InMemoryRateLimiter()
+        await limiter.is_allowed("a:/path", limit=1, window=10)
+
+        allowed, _ = await limiter.is_allowed("b:/path", limit=1, window=10)
+        assert allowed
+
+    async def test_blocked_key_is_rejected_until_the_block_expires(self, clock):
+        limiter = InMemoryRateLimiter()
+        limiter.blocked_ips["ip:/path"] = clock.value + 30
+
+        allowed, info = await limiter.is_allowed("ip:/path", limit=3, window=10)
+        assert not allowed
+        assert info["blocked_for"] == 30
+
+        clock.value += 30
+        allowed, _ = await limiter.is_allowed("ip:/path", limit=3, window=10)
+        assert allowed
+
+    async def test_expired_keys_and_blocks_are_collected(self, clock):
+        limiter = InMemoryRateLimiter()
+        await limiter.is_allowed("old:/path", limit=3, window=10)
+        limiter.blocked_ips["blocked:/path"] = clock.value + 5
+        limiter.blocked_ips["still-blocked:/path"] = clock.value + 3600
+
+        clock.value += limiter.gc_interval + 1
+        await limiter.is_allowed("new:/path", limit=3, window=10)
+
+        assert set(limiter.requests) == {"new:/path"}
+        assert set(limiter.blocked_ips) == {"still-blocked:/path"}
+
+    async def test_collection_keeps_keys_inside_their_window(self, clock):
+        limiter = InMemoryRateLimiter()
+        await limiter.is_allowed("long:/path", limit=3, window=3600)
+
+        clock.value += limiter.gc_interval + 1
+        await limiter.is_allowed("other:/path", limit=3, window=10)
+
+        assert "long:/path" in limiter.requests